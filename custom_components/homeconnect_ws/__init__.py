@@ -2,48 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID, CONF_HOST
+from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID, CONF_HOST, Platform
+from homeassistant.core import callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
     ConfigEntryNotReady,
-    ServiceValidationError,
 )
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     DeviceInfo,
     format_mac,
 )
+from homeassistant.loader import async_get_integration
 from homeassistant.util.hass_dict import HassKey
 from homeconnect_websocket import HomeAppliance
+from homeconnect_websocket.session import HCSession
 
+from .connection_monitor import ConnectionMonitor
+from .connection_scheduler import ConnectionScheduler
 from .const import (
     CONF_AES_IV,
+    CONF_DESCRIPTION_HASH,
     CONF_DEV_OVERRIDE_HOST,
     CONF_DEV_OVERRIDE_PSK,
     CONF_DEV_SETUP_FROM_DUMP,
     CONF_PSK,
     DOMAIN,
-    PLATFORMS,
 )
+from .description_cache import (
+    EntityDescriptionCache,
+    get_cache_key,
+    share_entity_descriptions,
+)
+from .description_store import DescriptionStore
+from .discovery_cache import DiscoveryCache
 from .entity_descriptions import get_available_entities
-from .helpers import get_config_entry_from_call
+from .helpers import get_required_platforms
+from .network_sampler import NetworkInfoSampler
+from .program_catalogue import get_program_catalogue_from_descriptions
+from .services import async_setup_services
+from .write_batcher import ValueWriteBatcher
+from .write_scheduler import StateWriteScheduler
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+    from homeassistant.core import HomeAssistant
     from homeassistant.helpers.typing import ConfigType
+    from homeconnect_websocket import DeviceDescription
 
     from .entity_descriptions import _EntityDescriptionsType
+    from .program_catalogue import ProgramCatalogue
 
 _LOGGER = logging.getLogger(__name__)
 
+# Retry delays in seconds of deferred connections
+DEFERRED_RETRY_MIN = 10
+DEFERRED_RETRY_MAX = 300
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: {
@@ -63,6 +87,14 @@ class HCData:
     appliance: HomeAppliance
     device_info: DeviceInfo
     available_entity_descriptions: _EntityDescriptionsType
+    write_scheduler: StateWriteScheduler | None = None
+    connection_monitor: ConnectionMonitor | None = None
+    network_sampler: NetworkInfoSampler | None = None
+    write_batcher: ValueWriteBatcher | None = None
+    platforms: set[Platform] = field(default_factory=set)
+    program_catalogue: ProgramCatalogue | None = None
+    host: str | None = None
+    connect_task: asyncio.Task | None = None
 
 
 @dataclass
@@ -72,6 +104,10 @@ class HCConfig:
     setup_from_dump: bool = False
     override_host: str | None = None
     override_psk: str | None = None
+    connection_scheduler: ConnectionScheduler | None = None
+    discovery_cache: DiscoveryCache | None = None
+    description_store: DescriptionStore | None = None
+    entity_descriptions: dict[str, _EntityDescriptionsType] = field(default_factory=dict)
 
 
 type HCConfigEntry = ConfigEntry[HCData]
@@ -82,75 +118,52 @@ HC_KEY: HassKey[HCConfig] = HassKey(DOMAIN)
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up integration global config."""
     hass.data.setdefault(DOMAIN, HCConfig())
+    hass.data[HC_KEY].connection_scheduler = ConnectionScheduler(hass)
+    hass.data[HC_KEY].discovery_cache = DiscoveryCache(hass)
+    get_description_store(hass)
     if DOMAIN in config:
         hass.data[HC_KEY].setup_from_dump = config[DOMAIN].get(CONF_DEV_SETUP_FROM_DUMP, False)
         hass.data[HC_KEY].override_host = config[DOMAIN].get(CONF_DEV_OVERRIDE_HOST)
         hass.data[HC_KEY].override_psk = config[DOMAIN].get(CONF_DEV_OVERRIDE_PSK)
 
-    async def handle_start_program(call: ServiceCall) -> ServiceResponse:
-        config_entry = await get_config_entry_from_call(hass, call)
-
-        options = {}
-        appliance = config_entry.runtime_data.appliance
-        if "start_in" in call.data:
-            if start_in_entity := appliance.entities.get("BSH.Common.Option.StartInRelative"):
-                relative_time_in_seconds = (
-                    int(call.data["start_in"].get("hours", 0)) * 3600
-                    + int(call.data["start_in"].get("minutes", 0)) * 60
-                    + int(call.data["start_in"].get("seconds", 0))
-                )
-                options[start_in_entity.uid] = relative_time_in_seconds
-            else:
-                msg = "'Start in' is not available on this Appliance"
-                raise ServiceValidationError(msg)
-        if "finish_in" in call.data:
-            if finish_in_entity := appliance.entities.get("BSH.Common.Option.FinishInRelative"):
-                relative_time_in_seconds = (
-                    int(call.data["finish_in"].get("hours", 0)) * 3600
-                    + int(call.data["finish_in"].get("minutes", 0)) * 60
-                    + int(call.data["finish_in"].get("seconds", 0))
-                )
-                options[finish_in_entity.uid] = relative_time_in_seconds
-            else:
-                msg = "'Finish in' is not available on this Appliance"
-                raise ServiceValidationError(msg)
-        if appliance.selected_program:
-            await appliance.selected_program.start(options)
-        else:
-            msg = "No Program selected"
-            raise ServiceValidationError(msg)
-
-    async def handle_set_start_in(call: ServiceCall) -> ServiceResponse:
-        config_entry = await get_config_entry_from_call(hass, call)
-        appliance = config_entry.runtime_data.appliance
-        if start_in_entity := appliance.entities.get("BSH.Common.Option.StartInRelative"):
-            relative_time_in_seconds = (
-                int(call.data["start_in"].get("hours", 0)) * 3600
-                + int(call.data["start_in"].get("minutes", 0)) * 60
-                + int(call.data["start_in"].get("seconds", 0))
-            )
-            await start_in_entity.set_value(relative_time_in_seconds)
-        else:
-            msg = "'Start in' is not available on this Appliance"
-            raise ServiceValidationError(msg)
-
-    async def handle_set_finish_in(call: ServiceCall) -> ServiceResponse:
-        config_entry = await get_config_entry_from_call(hass, call)
-        appliance = config_entry.runtime_data.appliance
-        if finish_in_entity := appliance.entities.get("BSH.Common.Option.FinishInRelative"):
-            relative_time_in_seconds = (
-                int(call.data["finish_in"].get("hours", 0)) * 3600
-                + int(call.data["finish_in"].get("minutes", 0)) * 60
-                + int(call.data["finish_in"].get("seconds", 0))
-            )
-            await finish_in_entity.set_value(relative_time_in_seconds)
-        else:
-            msg = "'Finish in' is not available on this Appliance"
-            raise ServiceValidationError(msg)
+    async_setup_services(hass)
+    return True
+
 
-    hass.services.async_register(DOMAIN, "start_program", handle_start_program)
-    hass.services.async_register(DOMAIN, "set_start_in", handle_set_start_in)
-    hass.services.async_register(DOMAIN, "set_finish_in", handle_set_finish_in)
+def get_description_store(hass: HomeAssistant) -> DescriptionStore:
+    """Get the description store, config flows can run before async_setup."""
+    hc_config = hass.data.setdefault(HC_KEY, HCConfig())
+    if hc_config.description_store is None:
+        hc_config.description_store = DescriptionStore(hass)
+    return hc_config.description_store
+
+
+async def async_remove_unused_descriptions(
+    hass: HomeAssistant, removed_entry_id: str | None = None
+) -> None:
+    """Remove stored descriptions no config entry references anymore."""
+    used_hashes = {
+        entry.data[CONF_DESCRIPTION_HASH]
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != removed_entry_id and CONF_DESCRIPTION_HASH in entry.data
+    }
+    await get_description_store(hass).async_remove_unused(used_hashes)
+
+
+async def async_migrate_entry(hass: HomeAssistant, config_entry: HCConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if config_entry.version > 2:
+        # Downgraded from a future version
+        return False
+    if config_entry.version == 1:
+        # The description is moved from the entry to the description store
+        data = {key: value for key, value in config_entry.data.items() if key != CONF_DESCRIPTION}
+        if CONF_DESCRIPTION in config_entry.data:
+            data[CONF_DESCRIPTION_HASH] = await get_description_store(hass).async_add(
+                config_entry.data[CONF_DESCRIPTION]
+            )
+        hass.config_entries.async_update_entry(config_entry, data=data, version=2)
+        _LOGGER.debug("Migrated config entry to version 2")
     return True
 
 
@@ -159,17 +172,98 @@ async def async_setup_entry(
     config_entry: HCConfigEntry,
 ) -> bool:
     """Set up this integration using config entry."""
-    _LOGGER.debug("Setting up %s", config_entry.data[CONF_DESCRIPTION]["info"].get("model"))
+    description = await _async_get_description(hass, config_entry)
+    _LOGGER.debug("Setting up %s", description["info"].get("model"))
     appliance = HomeAppliance(
-        description=config_entry.data[CONF_DESCRIPTION],
+        description=description,
         host=config_entry.data[CONF_HOST],
         app_name="Homeassistant",
         app_id=config_entry.data[CONF_DEVICE_ID],
         psk64=config_entry.data[CONF_PSK],
         iv64=config_entry.data.get(CONF_AES_IV, None),
     )
+    connection_scheduler = hass.data[HC_KEY].connection_scheduler
+    integration = await async_get_integration(hass, DOMAIN)
+    cache_key = get_cache_key(description, str(integration.version))
+    description_cache = EntityDescriptionCache(hass, config_entry.entry_id)
+    available_entities = await description_cache.async_load(cache_key, appliance)
+    deferred = available_entities is not None and bool(description_cache.info)
+    if deferred:
+        # Entities are created from the stored descriptions, connect in the background
+        _LOGGER.debug("Deferring connection to %s", config_entry.data[CONF_HOST])
+        appliance.info = description_cache.info
+    else:
+        await _async_connect(hass, config_entry, appliance)
+        _LOGGER.debug("Connected to %s", appliance.info.get("vib"))
+        if not appliance.info:
+            msg = "Appliance has no device info"
+            raise ConfigEntryError(msg)
+        _LOGGER.debug("Resolving Entity descriptions")
+        available_entities = get_available_entities(appliance)
+        await description_cache.async_save(cache_key, available_entities, dict(appliance.info))
+    # Appliances of the same model use the same Entity descriptions
+    available_entities = share_entity_descriptions(
+        hass.data[HC_KEY].entity_descriptions, cache_key, available_entities
+    )
+
+    device_info = DeviceInfo(
+        connections={(CONNECTION_NETWORK_MAC, format_mac(appliance.info["mac"]))},
+        hw_version=appliance.info["hwVersion"],
+        identifiers={(DOMAIN, appliance.info["deviceID"])},
+        name=f"{appliance.info['brand'].capitalize()} {appliance.info['type']}",
+        manufacturer=appliance.info["brand"].capitalize(),
+        model=f"{appliance.info['type']}",
+        model_id=appliance.info["vib"],
+        sw_version=appliance.info["swVersion"],
+    )
+    connection_monitor = ConnectionMonitor(hass, appliance)
+    connection_monitor.async_start()
+    connection_monitor.async_add_listener(
+        partial(connection_scheduler.async_set_connected, config_entry.entry_id)
+    )
+    config_entry.runtime_data = HCData(
+        appliance,
+        device_info,
+        available_entities,
+        StateWriteScheduler(hass, appliance),
+        connection_monitor,
+        NetworkInfoSampler(hass, appliance, connection_monitor),
+        ValueWriteBatcher(hass, appliance),
+        program_catalogue=get_program_catalogue_from_descriptions(available_entities),
+        host=config_entry.data[CONF_HOST],
+    )
+    if config_entry.runtime_data.program_catalogue is not None:
+        config_entry.runtime_data.program_catalogue.async_start()
+    await async_forward_platforms(hass, config_entry)
+    if deferred:
+        _async_start_connect(hass, config_entry)
+    else:
+        connection_scheduler.async_set_connected(config_entry.entry_id, True)  # noqa: FBT003
+    config_entry.async_on_unload(config_entry.add_update_listener(_async_entry_updated))
+    return True
+
+
+async def async_forward_platforms(hass: HomeAssistant, config_entry: HCConfigEntry) -> None:
+    """Forward the platforms that have descriptions and are not set up yet."""
+    runtime_data = config_entry.runtime_data
+    platforms = [
+        platform
+        for platform in get_required_platforms(runtime_data.available_entity_descriptions)
+        if platform not in runtime_data.platforms
+    ]
+    if not platforms:
+        return
+    _LOGGER.debug("Forwarding platforms %s", platforms)
+    runtime_data.platforms.update(platforms)
+    await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
+
+
+async def _async_connect(
+    hass: HomeAssistant, config_entry: HCConfigEntry, appliance: HomeAppliance
+) -> None:
+    """Connect the appliance, closes the appliance on failure."""
     try:
-        await appliance.connect()
+        await hass.data[HC_KEY].connection_scheduler.async_connect(config_entry.entry_id, appliance)
     except ClientConnectorSSLError as ex:
         await appliance.close()
         msg = f"Authentication failed with {config_entry.data[CONF_HOST]}"
@@ -182,31 +276,122 @@ async def async_setup_entry(
         await appliance.close()
         raise
 
-    _LOGGER.debug("Connected to %s", config_entry.data[CONF_DESCRIPTION]["info"].get("vib"))
-    if not appliance.info:
-        msg = "Appliance has no device info"
-        raise ConfigEntryError(msg)
 
-    device_info = DeviceInfo(
-        connections={(CONNECTION_NETWORK_MAC, format_mac(appliance.info["mac"]))},
-        hw_version=appliance.info["hwVersion"],
-        identifiers={(DOMAIN, appliance.info["deviceID"])},
-        name=f"{appliance.info['brand'].capitalize()} {appliance.info['type']}",
-        manufacturer=appliance.info["brand"].capitalize(),
-        model=f"{appliance.info['type']}",
-        model_id=appliance.info["vib"],
-        sw_version=appliance.info["swVersion"],
+async def _async_get_description(
+    hass: HomeAssistant, config_entry: HCConfigEntry
+) -> DeviceDescription:
+    """Get the device description from the description store."""
+    description = None
+    if CONF_DESCRIPTION_HASH in config_entry.data:
+        description = await get_description_store(hass).async_get(
+            config_entry.data[CONF_DESCRIPTION_HASH]
+        )
+    if description is None:
+        # The profile file has to be uploaded again
+        msg = "Device description is missing"
+        raise ConfigEntryAuthFailed(msg)
+    return description
+
+
+@callback
+def _async_start_connect(hass: HomeAssistant, config_entry: HCConfigEntry) -> None:
+    """Connect the appliance in the background."""
+    runtime_data = config_entry.runtime_data
+    runtime_data.connect_task = config_entry.async_create_background_task(
+        hass,
+        _async_deferred_connect(hass, config_entry, runtime_data.appliance),
+        f"homeconnect_ws connect {config_entry.title}",
+    )
+
+
+async def _async_entry_updated(hass: HomeAssistant, config_entry: HCConfigEntry) -> None:
+    """Move the appliance to a changed host without reloading the entry."""
+    runtime_data = config_entry.runtime_data
+    if config_entry.data[CONF_HOST] == runtime_data.host:
+        return
+    runtime_data.host = config_entry.data[CONF_HOST]
+    _LOGGER.debug("Reconnecting %s to %s", config_entry.title, runtime_data.host)
+    if runtime_data.connect_task is not None:
+        runtime_data.connect_task.cancel()
+    # Only the session is replaced, the appliance and its Entities are kept
+    await runtime_data.appliance.close()
+    runtime_data.appliance.session = _create_session(config_entry)
+    runtime_data.connection_monitor.async_start()
+    _async_start_connect(hass, config_entry)
+
+
+async def _async_deferred_connect(
+    hass: HomeAssistant, config_entry: HCConfigEntry, appliance: HomeAppliance
+) -> None:
+    """Connect the appliance in the background, retrying until it is reachable."""
+    retry_delay = DEFERRED_RETRY_MIN
+    while True:
+        try:
+            await hass.data[HC_KEY].connection_scheduler.async_connect(
+                config_entry.entry_id, appliance
+            )
+        except ClientConnectorSSLError:
+            _LOGGER.debug("Authentication failed with %s", config_entry.data[CONF_HOST])
+            config_entry.async_start_reauth(hass)
+            return
+        except (TimeoutError, ClientConnectionError):
+            _LOGGER.debug(
+                "Can't connect to %s, retrying in %s s", config_entry.data[CONF_HOST], retry_delay
+            )
+        except Exception:
+            _LOGGER.exception(
+                "Error connecting to %s, retrying in %s s",
+                config_entry.data[CONF_HOST],
+                retry_delay,
+            )
+        else:
+            if appliance.session.connected:
+                _LOGGER.debug("Connected to %s", appliance.info.get("vib"))
+                return
+            # The library closes the session after a failed handshake
+            _LOGGER.debug(
+                "Handshake with %s failed, retrying in %s s",
+                config_entry.data[CONF_HOST],
+                retry_delay,
+            )
+        # A timed out handshake leaves the socket open
+        await appliance.close()
+        await asyncio.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, DEFERRED_RETRY_MAX)
+        # A closed session can't reconnect
+        appliance.session = _create_session(config_entry)
+        config_entry.runtime_data.connection_monitor.async_start()
+
+
+def _create_session(config_entry: HCConfigEntry) -> HCSession:
+    """Create a session with the same arguments as the HomeAppliance of the entry."""
+    return HCSession(
+        host=config_entry.data[CONF_HOST],
+        app_name="Homeassistant",
+        app_id=config_entry.data[CONF_DEVICE_ID],
+        psk64=config_entry.data[CONF_PSK],
+        iv64=config_entry.data.get(CONF_AES_IV, None),
     )
-    available_entities = get_available_entities(appliance)
-    config_entry.runtime_data = HCData(appliance, device_info, available_entities)
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
-    return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: HCConfigEntry) -> bool:
     """Unload a config entry."""
-    _LOGGER.debug("Unloading %s", entry.data[CONF_DESCRIPTION]["info"].get("vib"))
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    _LOGGER.debug("Unloading %s", entry.runtime_data.appliance.info.get("vib"))
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, list(entry.runtime_data.platforms)
+    )
     if unload_ok:
+        entry.runtime_data.write_scheduler.async_shutdown()
+        entry.runtime_data.write_batcher.async_shutdown()
+        entry.runtime_data.network_sampler.async_stop()
+        entry.runtime_data.connection_monitor.async_stop()
+        if entry.runtime_data.program_catalogue is not None:
+            entry.runtime_data.program_catalogue.async_stop()
         await entry.runtime_data.appliance.close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: HCConfigEntry) -> None:
+    """Remove stored data of a config entry."""
+    await EntityDescriptionCache(hass, entry.entry_id).async_remove()
+    await async_remove_unused_descriptions(hass, entry.entry_id)
@@ -68,7 +68,7 @@ class HCConnectionSensor(BinarySensorEntity):
     """Connection sensor Entity."""
 
     _attr_has_entity_name = True
-    _attr_should_poll = True
+    _attr_should_poll = False
     _attr_available = True
     entity_description: HCBinarySensorEntityDescription
 
@@ -85,6 +85,13 @@ class HCConnectionSensor(BinarySensorEntity):
         self._attr_device_info: DeviceInfo = device_info
         self._attr_translation_key = entity_description.key
 
+    async def async_added_to_hass(self) -> None:
+        connection_monitor = self.platform.config_entry.runtime_data.connection_monitor
+        self.async_on_remove(connection_monitor.async_add_listener(self._async_connection_changed))
+
+    def _async_connection_changed(self, _: bool) -> None:  # noqa: FBT001
+        self.async_write_ha_state()
+
     @property
     def is_on(self) -> bool:
         return self._appliance.session.connected
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import random
-import re
+import shutil
+import tempfile
 from binascii import Error as BinasciiError
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from zipfile import ZipFile
 
@@ -23,6 +26,7 @@ from homeassistant.const import (
     CONF_MODE,
     CONF_NAME,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.selector import (
     FileSelector,
     FileSelectorConfig,
@@ -37,12 +41,18 @@ from homeconnect_websocket import (
     parse_device_description,
 )
 
-from . import HC_KEY, HCConfig
-from .const import CONF_AES_IV, CONF_FILE, CONF_MANUAL_HOST, CONF_PSK, DOMAIN
+from . import HC_KEY, HCConfig, async_remove_unused_descriptions, get_description_store
+from .const import (
+    CONF_AES_IV,
+    CONF_DESCRIPTION_HASH,
+    CONF_FILE,
+    CONF_MANUAL_HOST,
+    CONF_PSK,
+    DOMAIN,
+)
+from .discovery_cache import async_update_host
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from homeassistant.config_entries import ConfigFlowResult
     from homeassistant.data_entry_flow import FlowResult
     from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
@@ -51,6 +61,11 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Overall time to find a reachable host
+CONNECT_DEADLINE = 15
+# Head start of a candidate host before the next one is tried
+CANDIDATE_DELAY = 0.5
+
 CONFIG_FILE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_FILE): FileSelector(config=FileSelectorConfig(accept=".zip")),
@@ -69,30 +84,28 @@ CONFIG_HOST_SCHEMA = vol.Schema(
 
 
 def process_zip_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDescription]]:
-    """Process uploaded zip file."""
-    profile_file = ZipFile(config_path)
-
+    """Index uploaded zip file, only the appliance info files are read."""
     appliances = {}
-    re_info = re.compile(".*.json$")
-    infolist = profile_file.infolist()
-    for file in infolist:
-        if re_info.match(file.filename):
-            appliance_info = json.load(profile_file.open(file))
-
-            description_file_name = appliance_info["deviceDescriptionFileName"]
-            feature_file_name = appliance_info["featureMappingFileName"]
-            description_file = profile_file.open(description_file_name).read()
-            feature_file = profile_file.open(feature_file_name).read()
-
-            appliance_description = parse_device_description(description_file, feature_file)
-            appliances[appliance_info["haId"]] = {
-                "info": appliance_info,
-                "description": appliance_description,
-            }
-            _LOGGER.debug("Found Appliance %s", appliance_info["vib"])
+    with ZipFile(config_path) as profile_file:
+        for file in profile_file.infolist():
+            if file.filename.endswith(".json"):
+                with profile_file.open(file) as info_file:
+                    appliance_info = json.load(info_file)
+                appliances[appliance_info["haId"]] = {"info": appliance_info}
+                _LOGGER.debug("Found Appliance %s", appliance_info["vib"])
     return appliances
 
 
+def parse_zip_appliance(config_path: Path, appliance_info: dict) -> DeviceDescription:
+    """Parse the description of one appliance, streamed from the zip file."""
+    with (
+        ZipFile(config_path) as profile_file,
+        profile_file.open(appliance_info["deviceDescriptionFileName"]) as description_file,
+        profile_file.open(appliance_info["featureMappingFileName"]) as feature_file,
+    ):
+        return parse_device_description(description_file, feature_file)
+
+
 def process_json_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDescription]]:
     """Process uploaded json file."""
     with config_path.open() as file:
@@ -103,6 +116,8 @@ def process_json_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDes
 class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
     """HomeConnect Config flow."""
 
+    VERSION = 2
+
     def __init__(self) -> None:
         super().__init__()
         self.errors = {}
@@ -110,13 +125,24 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         self.appliances: dict[str, dict[str, dict | DeviceDescription]] = {}
         self.reauth_entry: HCConfigEntry = None
         self.global_config: HCConfig | None = None
+        self.profile_file: Path | None = None
+        self.candidate_hosts: list[str] = []
 
     def _process_profile_file(
         self, uploaded_file_id: str
     ) -> dict[str, dict[str, dict | DeviceDescription]]:
         with process_uploaded_file(self.hass, uploaded_file_id) as config_path:
             if config_path.suffix == ".zip":
-                return process_zip_file(config_path)
+                appliances = process_zip_file(config_path)
+                # Keep a copy, the description is parsed after the device is selected
+                self._remove_profile_file()
+                with (
+                    tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as profile_file,
+                    config_path.open("rb") as file,
+                ):
+                    self.profile_file = Path(profile_file.name)
+                    shutil.copyfileobj(file, profile_file)
+                return appliances
             if config_path.suffix == ".json":
                 return process_json_file(config_path)
             msg = "Unexpected profile file suffix: %s"
@@ -125,17 +151,15 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
     def _set_encryption_keys(self, appliance_info: dict) -> None:
         self.data[CONF_MODE] = appliance_info["connectionType"]
         if self.data[CONF_MODE] == "TLS":
-            if CONF_HOST not in self.data:
-                self.data[CONF_HOST] = (
-                    f"{appliance_info['brand']}-{appliance_info['type']}-{appliance_info['haId']}"
-                )
-                _LOGGER.debug("Set Host to: %s", self.data[CONF_HOST])
-            self.data[CONF_PSK] = appliance_info["key"]
+            host = f"{appliance_info['brand']}-{appliance_info['type']}-{appliance_info['haId']}"
         else:
-            if CONF_HOST not in self.data:
-                self.data[CONF_HOST] = appliance_info["haId"]
-                _LOGGER.debug("Set Host to: %s", self.data[CONF_HOST])
-            self.data[CONF_PSK] = appliance_info["key"]
+            host = appliance_info["haId"]
+        self.candidate_hosts.append(host)
+        if CONF_HOST not in self.data:
+            self.data[CONF_HOST] = host
+            _LOGGER.debug("Set Host to: %s", self.data[CONF_HOST])
+        self.data[CONF_PSK] = appliance_info["key"]
+        if self.data[CONF_MODE] == "AES":
             self.data[CONF_AES_IV] = appliance_info["iv"]
         _LOGGER.debug("Set Keys for %s Appliance", self.data[CONF_MODE])
 
@@ -152,6 +176,17 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
                 self.data[CONF_AES_IV] = None
                 _LOGGER.info("PSK override")
 
+    def _remove_profile_file(self) -> None:
+        if self.profile_file is not None:
+            self.profile_file.unlink(missing_ok=True)
+            self.profile_file = None
+
+    @callback
+    def async_remove(self) -> None:
+        """Remove the profile file copy when the flow is aborted."""
+        if self.profile_file is not None:
+            self.hass.async_add_executor_job(self._remove_profile_file)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle a flow initialized by the user."""
         _LOGGER.debug("Config flow initialized by user")
@@ -256,29 +291,89 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Test connection with Appliance."""
-        host = self.data[CONF_HOST]
         _LOGGER.debug("Testing connection to %s Appliance", self.data[CONF_MODE])
         self.errors = {}
-        if self.data[CONF_MODE] == "AES":
-            socket = hc_socket.AesSocket(host, self.data[CONF_PSK], self.data[CONF_AES_IV])
-        else:
-            socket = hc_socket.TlsSocket(host, self.data[CONF_PSK])
         try:
-            await socket.connect()
+            host = await self._async_race_hosts(self._get_candidate_hosts())
         except (ClientConnectorSSLError, BinasciiError) as ex:
             _LOGGER.debug("validate_config failed: %s", ex)
             return self.async_abort(reason="auth_failed")
-        except (TimeoutError, ClientConnectionError) as ex:
-            _LOGGER.debug("validate_config failed: %s", ex)
+        if host is None:
             self.errors["base"] = "cannot_connect"
-        finally:
-            await socket.close()
+        elif host != self.data[CONF_HOST]:
+            _LOGGER.debug("Set Host to: %s", host)
+            self.data[CONF_HOST] = host
         if self.errors:
             _LOGGER.debug("Connection error, showing host step")
             return await self.async_step_host()
         _LOGGER.debug("config vaild, adding config entry")
         return await self.async_step_create_entry(self.data)
 
+    def _get_candidate_hosts(self) -> list[str]:
+        """Get the hosts to try, the configured host first."""
+        if self.data.get(CONF_MANUAL_HOST, False):
+            return [self.data[CONF_HOST]]
+        hosts = [self.data[CONF_HOST], *self.candidate_hosts]
+        entry = self.reauth_entry or self.hass.config_entries.async_entry_for_domain_unique_id(
+            self.handler, self.unique_id
+        )
+        if entry and CONF_HOST in entry.data:
+            hosts.append(entry.data[CONF_HOST])
+        return list(dict.fromkeys(hosts))
+
+    async def _async_test_host(self, host: str) -> str:
+        if self.data[CONF_MODE] == "AES":
+            socket = hc_socket.AesSocket(host, self.data[CONF_PSK], self.data[CONF_AES_IV])
+        else:
+            socket = hc_socket.TlsSocket(host, self.data[CONF_PSK])
+        try:
+            await socket.connect()
+        finally:
+            await socket.close()
+        return host
+
+    async def _async_race_hosts(self, hosts: list[str]) -> str | None:
+        """
+        Connect to the candidate hosts, the first successful handshake wins.
+
+        Each host gets a head start of CANDIDATE_DELAY before the next one is started,
+        a failed host starts the next one immediately. Handshake errors are raised, all
+        hosts share the same keys.
+        """
+        remaining = iter(hosts)
+        tasks: list[asyncio.Task[str]] = []
+        pending: set[asyncio.Task[str]] = set()
+        try:
+            async with asyncio.timeout(CONNECT_DEADLINE):
+                while True:
+                    if (host := next(remaining, None)) is not None:
+                        _LOGGER.debug("Testing host %s", host)
+                        task = self.hass.async_create_task(self._async_test_host(host))
+                        tasks.append(task)
+                        pending.add(task)
+                    elif not pending:
+                        return None
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=CANDIDATE_DELAY if host is not None else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in done:
+                        try:
+                            return task.result()
+                        except (ClientConnectorSSLError, BinasciiError):
+                            # ClientConnectorSSLError is a ClientConnectionError
+                            raise
+                        except (TimeoutError, ClientConnectionError) as ex:
+                            _LOGGER.debug("Connection test failed: %s", ex)
+        except TimeoutError:
+            _LOGGER.debug("No host reachable within %s seconds", CONNECT_DEADLINE)
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def async_step_host(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle Host setting."""
         if user_input is not None:
@@ -299,11 +394,21 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
 
     async def async_step_create_entry(self, data: dict) -> ConfigFlowResult:
         """Create an config entry or update existing entry for reauth."""
+        if CONF_DESCRIPTION in data:
+            # The entry references the description by hash
+            description_hash = await get_description_store(self.hass).async_add(
+                data[CONF_DESCRIPTION]
+            )
+            data = {key: value for key, value in data.items() if key != CONF_DESCRIPTION}
+            data[CONF_DESCRIPTION_HASH] = description_hash
         if self.reauth_entry:
-            return self.async_update_reload_and_abort(
+            result = self.async_update_reload_and_abort(
                 self.reauth_entry,
                 data_updates=data,
             )
+            # The replaced description may not be used anymore
+            await async_remove_unused_descriptions(self.hass)
+            return result
         return self.async_create_entry(title=data[CONF_NAME], data=data)
 
     async def async_step_reauth(self, user_input: dict[str, Any]) -> ConfigFlowResult:
@@ -324,14 +429,26 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         try:
             appliance_info = appliance["info"]
 
+            if "description" not in appliance and self.profile_file is not None:
+                appliance["description"] = await self.hass.async_add_executor_job(
+                    parse_zip_appliance, self.profile_file, appliance_info
+                )
             self.data[CONF_DESCRIPTION] = appliance["description"]
 
             self.data[CONF_DEVICE_ID] = random.randbytes(4).hex()  # noqa: S311
             self.data[CONF_NAME] = f"{appliance_info['brand']} {appliance_info['type']}"
 
             self._set_encryption_keys(appliance_info)
+        except ParserError as exc:
+            return self.async_abort(
+                reason="profile_file_parser_error",
+                description_placeholders={"error": exc.args[0]},
+            )
         except (KeyError, ValueError):
             return self.async_abort(reason="invalid_profile_file")
+        finally:
+            if self.profile_file is not None:
+                await self.hass.async_add_executor_job(self._remove_profile_file)
 
         return await self.async_step_test_connection()
 
@@ -343,13 +460,22 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
                 discovery_info.host,
             )
             await self.async_set_unique_id(discovery_info.properties["id"])
-            updates = None
             config_entry = self.hass.config_entries.async_entry_for_domain_unique_id(
                 self.handler, self.unique_id
             )
-            if config_entry and not config_entry.data.get(CONF_MANUAL_HOST, False):
-                updates = {CONF_HOST: str(discovery_info.ip_address)}
-            self._abort_if_unique_id_configured(updates=updates)
+            if (
+                config_entry
+                and CONF_HOST in config_entry.data
+                and not config_entry.data.get(CONF_MANUAL_HOST, False)
+            ):
+                # Update the host without reloading the entry
+                host = str(discovery_info.ip_address)
+                global_config = self.hass.data.get(HC_KEY)
+                if global_config and global_config.discovery_cache:
+                    global_config.discovery_cache.async_discovered(config_entry, host)
+                elif config_entry.data[CONF_HOST] != host:
+                    async_update_host(self.hass, config_entry, host)
+            self._abort_if_unique_id_configured()
             self.data[CONF_HOST] = str(discovery_info.ip_address)
             self.data[CONF_NAME] = (
                 f"{discovery_info.properties['brand']} {discovery_info.properties['type']}"
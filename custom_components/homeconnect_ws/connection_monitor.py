@@ -0,0 +1,109 @@
+"""Session connection state monitor."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+from homeconnect_websocket.session import ConnectionState
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+
+_LOGGER = logging.getLogger(__name__)
+
+# Disconnects shorter than this don't make the Entities unavailable,
+# the library reopens the socket a few times before the outage is reported
+RECONNECT_GRACE = 10
+
+
+class ConnectionMonitor:
+    """Push session connect and disconnect transitions to listeners."""
+
+    def __init__(self, hass: HomeAssistant, appliance: HomeAppliance) -> None:
+        self._hass = hass
+        self._appliance = appliance
+        self._listeners: list[Callable[[bool], None]] = []
+        self._availability_listeners: list[Callable[[], None]] = []
+        self._cancel_grace: CALLBACK_TYPE | None = None
+        self.connected: bool = bool(appliance.session.connected)
+        # False until the first connect and after a disconnect outlasting the grace time
+        self.available: bool = self.connected
+
+    @callback
+    def async_start(self) -> None:
+        """Start watching the session's connection state."""
+        self._appliance.session.connection_state_callback = self._async_connection_state_changed
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching the session."""
+        session = self._appliance.session
+        if session.connection_state_callback == self._async_connection_state_changed:
+            session.connection_state_callback = None
+        self._async_cancel_grace()
+        self._listeners.clear()
+        self._availability_listeners.clear()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[bool], None]) -> CALLBACK_TYPE:
+        """Add a listener called with the new state on every transition."""
+        return self._add_listener(self._listeners, listener)
+
+    @callback
+    def async_add_availability_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Add a listener called when available changes."""
+        return self._add_listener(self._availability_listeners, listener)
+
+    @staticmethod
+    def _add_listener(listeners: list[Callable], listener: Callable) -> CALLBACK_TYPE:
+        listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+
+        return remove_listener
+
+    async def _async_connection_state_changed(self, state: ConnectionState) -> None:
+        connected = state is ConnectionState.CONNECTED
+        if connected == self.connected:
+            return
+        self.connected = connected
+        _LOGGER.debug("Appliance %s", "connected" if connected else "disconnected")
+        for listener in list(self._listeners):
+            listener(connected)
+        if connected:
+            self._async_cancel_grace()
+            self._async_set_available(available=True)
+        elif self.available:
+            self._cancel_grace = async_call_later(
+                self._hass, RECONNECT_GRACE, self._async_grace_expired
+            )
+
+    @callback
+    def _async_grace_expired(self, _: datetime) -> None:
+        self._cancel_grace = None
+        _LOGGER.debug("Appliance didn't reconnect within %s s", RECONNECT_GRACE)
+        self._async_set_available(available=False)
+
+    @callback
+    def _async_cancel_grace(self) -> None:
+        if self._cancel_grace is not None:
+            self._cancel_grace()
+            self._cancel_grace = None
+
+    @callback
+    def _async_set_available(self, *, available: bool) -> None:
+        if available == self.available:
+            return
+        self.available = available
+        for listener in list(self._availability_listeners):
+            listener()
@@ -0,0 +1,103 @@
+"""Integration wide scheduling of appliance connections."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+MAX_CONCURRENT_CONNECTIONS = 3
+PRIORITY_CONNECTED = 0
+PRIORITY_DEFAULT = 1
+# Seconds a handshake may hold a connection slot, the library waits up to 60 s
+CONNECT_TIMEOUT = 30
+
+
+class ConnectionScheduler:
+    """
+    Limit the number of concurrent appliance handshakes.
+
+    Appliances that were connected when Home Assistant stopped are connected first.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_connections: int = MAX_CONCURRENT_CONNECTIONS
+    ) -> None:
+        self._hass = hass
+        self._max_connections = max_connections
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._store: Store[list[str]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.connection_scheduler"
+        )
+        self._load_lock = asyncio.Lock()
+        self._connected: set[str] | None = None
+
+    async def _async_load(self) -> set[str]:
+        async with self._load_lock:
+            if self._connected is None:
+                self._connected = set(await self._store.async_load() or [])
+        return self._connected
+
+    async def async_connect(self, entry_id: str, appliance: HomeAppliance) -> None:
+        """Connect the appliance once a connection slot is free."""
+        connected = await self._async_load()
+        priority = PRIORITY_CONNECTED if entry_id in connected else PRIORITY_DEFAULT
+        await self._async_acquire(priority)
+        try:
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                await appliance.connect()
+        finally:
+            self._async_release()
+
+    async def _async_acquire(self, priority: int) -> None:
+        if self._active < self._max_connections and not self._waiters:
+            self._active += 1
+            return
+        waiter = self._hass.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over before the cancellation
+                self._async_release()
+            raise
+
+    @callback
+    def _async_release(self) -> None:
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # Hand the slot over to the next waiter
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    @callback
+    def async_set_connected(self, entry_id: str, connected: bool) -> None:  # noqa: FBT001
+        """Record the connection state of an appliance."""
+        if self._connected is None:
+            return
+        if connected:
+            self._connected.add(entry_id)
+        else:
+            self._connected.discard(entry_id)
+        self._store.async_delay_save(lambda: sorted(self._connected), STORAGE_SAVE_DELAY)
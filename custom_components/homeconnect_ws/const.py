@@ -18,10 +18,23 @@ PLATFORMS: Final = [
     Platform.FAN,
 ]
 
+# Description types of each platform
+PLATFORM_DESCRIPTION_TYPES: Final = {
+    Platform.BINARY_SENSOR: ("binary_sensor",),
+    Platform.SENSOR: ("sensor", "event_sensor", "active_program", "wifi"),
+    Platform.SWITCH: ("switch",),
+    Platform.SELECT: ("select", "program"),
+    Platform.BUTTON: ("button", "start_button"),
+    Platform.NUMBER: ("number",),
+    Platform.LIGHT: ("light",),
+    Platform.FAN: ("fan",),
+}
+
 CONF_PSK: Final = "psk"
 CONF_AES_IV: Final = "aes_iv"
 CONF_FILE: Final = "file"
 CONF_MANUAL_HOST: Final = "manual_host"
+CONF_DESCRIPTION_HASH: Final = "description_hash"
 CONF_DEV_SETUP_FROM_DUMP: Final = "setup_from_dump_enabled"
 CONF_DEV_OVERRIDE_HOST: Final = "override_host"
 CONF_DEV_OVERRIDE_PSK: Final = "override_psk"
@@ -0,0 +1,193 @@
+"""Persistent cache of resolved Entity descriptions."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import importlib
+import json
+import logging
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .entity_descriptions import (
+    descriptions_definitions,
+    get_static_description,
+    get_static_reference,
+)
+from .entity_descriptions.common import generate_program
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import DeviceDescription, HomeAppliance
+
+    from .entity_descriptions import HCEntityDescription, _EntityDescriptionsType
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Changed when the stored description format changes
+CACHE_FORMAT = 2
+
+
+class DescriptionSerializationError(Exception):
+    """Entity description can't be stored."""
+
+
+# Program names depend on the favorite names set on the appliance
+PROGRAM_DESCRIPTION_TYPES = ("program", "active_program")
+
+
+def get_cache_key(description: DeviceDescription, integration_version: str) -> str:
+    """Get the cache key for a device description and integration version."""
+    # the appliance info doesn't change the resolved descriptions
+    sections = {key: value for key, value in description.items() if key != "info"}
+    data = json.dumps(sections, sort_keys=True, default=str)
+    return hashlib.sha256(f"{CACHE_FORMAT}:{integration_version}:{data}".encode()).hexdigest()
+
+
+def share_entity_descriptions(
+    shared_descriptions: dict[str, _EntityDescriptionsType],
+    cache_key: str,
+    available_entities: _EntityDescriptionsType,
+) -> _EntityDescriptionsType:
+    """Use the resolved descriptions of identical appliance models, except programs."""
+    shared = shared_descriptions.setdefault(
+        cache_key,
+        {
+            description_type: descriptions
+            for description_type, descriptions in available_entities.items()
+            if description_type not in PROGRAM_DESCRIPTION_TYPES
+        },
+    )
+    return {**available_entities, **shared}
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        enum_type = type(value)
+        return {
+            "__enum__": f"{enum_type.__module__}:{enum_type.__qualname__}",
+            "value": value.value,
+        }
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, set | frozenset):
+        return {"__set__": [_encode_value(item) for item in value]}
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode_value(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {"__dict__": {str(key): _encode_value(item) for key, item in value.items()}}
+    msg = f"Can't store value of type {type(value).__name__}"
+    raise DescriptionSerializationError(msg)
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__enum__" in value:
+        module_name, qualname = value["__enum__"].split(":")
+        enum_type = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            enum_type = getattr(enum_type, name)
+        return enum_type(value["value"])
+    if "__set__" in value:
+        return {_decode_value(item) for item in value["__set__"]}
+    if "__tuple__" in value:
+        return tuple(_decode_value(item) for item in value["__tuple__"])
+    return {key: _decode_value(item) for key, item in value["__dict__"].items()}
+
+
+def serialize_description(description: HCEntityDescription) -> dict:
+    """Serialize an Entity description."""
+    if (reference := get_static_reference(description)) is not None:
+        # static descriptions are referenced by type, key and entities, not by position,
+        # positions change when descriptions are added
+        return {"ref": reference}
+
+    fields = {}
+    for field in dataclasses.fields(description):
+        value = getattr(description, field.name)
+        if field.default is not dataclasses.MISSING and value == field.default:
+            continue
+        fields[field.name] = _encode_value(value)
+    return {"class": type(description).__name__, "fields": fields}
+
+
+def deserialize_description(data: dict) -> HCEntityDescription:
+    """Deserialize an Entity description."""
+    if "ref" in data:
+        return get_static_description(data["ref"])
+    description_class = getattr(descriptions_definitions, data["class"])
+    fields = {name: _decode_value(value) for name, value in data["fields"].items()}
+    return description_class(**fields)
+
+
+class EntityDescriptionCache:
+    """Stores the resolved Entity descriptions of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._hass = hass
+        self._store_key = f"{DOMAIN}.entity_descriptions.{entry_id}"
+        self._store: Store[dict] = Store(hass, STORAGE_VERSION, self._store_key)
+        self.info: dict[str, Any] | None = None
+
+    async def async_load(
+        self, cache_key: str, appliance: HomeAppliance
+    ) -> _EntityDescriptionsType | None:
+        """
+        Load cached descriptions, returns None if there is no valid cache.
+
+        The stored appliance info is set as info.
+        """
+        self.info = None
+        data = await self._store.async_load()
+        if not data or data.get("key") != cache_key:
+            return None
+        try:
+            available_entities = {
+                description_type: [deserialize_description(item) for item in descriptions]
+                for description_type, descriptions in data["descriptions"].items()
+                if description_type not in PROGRAM_DESCRIPTION_TYPES
+            }
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Failed to load cached Entity descriptions", exc_info=True)
+            return None
+
+        # Program names depend on the favorite names set on the appliance
+        program_descriptions = generate_program(appliance)
+        available_entities["program"] = program_descriptions.get("program", [])
+        available_entities["active_program"] = program_descriptions.get("active_program", [])
+        self.info = data.get("info")
+        return available_entities
+
+    async def async_save(
+        self,
+        cache_key: str,
+        available_entities: _EntityDescriptionsType,
+        info: dict[str, Any] | None = None,
+    ) -> None:
+        """Store resolved descriptions and the appliance info."""
+        try:
+            descriptions = {
+                description_type: [serialize_description(item) for item in descriptions]
+                for description_type, descriptions in available_entities.items()
+                if description_type not in PROGRAM_DESCRIPTION_TYPES
+            }
+        except DescriptionSerializationError as exc:
+            _LOGGER.debug("Not caching Entity descriptions: %s", exc)
+            return
+        await self._store.async_save({"key": cache_key, "descriptions": descriptions, "info": info})
+
+    async def async_remove(self) -> None:
+        """Remove stored descriptions."""
+        await self._store.async_remove()
+        # the Store keeps the last saved data in memory
+        self._store = Store(self._hass, STORAGE_VERSION, self._store_key)
@@ -0,0 +1,92 @@
+"""Content-addressed store of device descriptions."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import DeviceDescription
+
+STORAGE_VERSION = 1
+
+# Description sections shared by appliances of the same model, keyed by VIB and hash
+_SHARED_SECTIONS: dict[tuple[str, str], dict[str, Any]] = {}
+
+
+def get_description_hash(description: DeviceDescription) -> str:
+    """Get the content hash of a device description."""
+    data = json.dumps(description, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def intern_description(description: DeviceDescription) -> DeviceDescription:
+    """
+    Get a description sharing its Entity sections with identical appliance models.
+
+    The shared sections must not be modified. The info is copied, the appliance
+    updates it in place.
+    """
+    info = description.get("info", {})
+    sections = {key: value for key, value in description.items() if key != "info"}
+    key = (info.get("vib", ""), get_description_hash(sections))
+    if (shared_sections := _SHARED_SECTIONS.get(key)) is None:
+        shared_sections = _SHARED_SECTIONS[key] = sections
+    return {**shared_sections, "info": dict(info)}
+
+
+class DescriptionStore:
+    """
+    Device descriptions stored once by content hash.
+
+    Config entries reference their description by hash, appliances of the same model
+    share the Entity sections of their descriptions in memory.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, DeviceDescription]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.device_descriptions"
+        )
+        self._load_lock = asyncio.Lock()
+        self._descriptions: dict[str, DeviceDescription] | None = None
+
+    async def _async_load(self) -> dict[str, DeviceDescription]:
+        async with self._load_lock:
+            if self._descriptions is None:
+                stored = await self._store.async_load() or {}
+                self._descriptions = {
+                    description_hash: intern_description(description)
+                    for description_hash, description in stored.items()
+                }
+        return self._descriptions
+
+    async def async_add(self, description: DeviceDescription) -> str:
+        """Add a description and return its hash, the store is saved before returning."""
+        descriptions = await self._async_load()
+        description_hash = get_description_hash(description)
+        if description_hash not in descriptions:
+            descriptions[description_hash] = intern_description(description)
+            await self._store.async_save(descriptions)
+        return description_hash
+
+    async def async_get(self, description_hash: str) -> DeviceDescription | None:
+        """Get a description by hash, the info is a copy owned by the caller."""
+        descriptions = await self._async_load()
+        if (description := descriptions.get(description_hash)) is None:
+            return None
+        return {**description, "info": dict(description.get("info", {}))}
+
+    async def async_remove_unused(self, used_hashes: set[str]) -> None:
+        """Remove descriptions not referenced by any config entry."""
+        descriptions = await self._async_load()
+        if unused_hashes := descriptions.keys() - used_hashes:
+            for description_hash in unused_hashes:
+                del descriptions[description_hash]
+            await self._store.async_save(descriptions)
@@ -5,9 +5,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
-from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID
 
-from .const import CONF_AES_IV, CONF_PSK
+from . import get_description_store
+from .const import CONF_AES_IV, CONF_DESCRIPTION_HASH, CONF_PSK
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -18,11 +19,20 @@ TO_REDACT = [CONF_PSK, CONF_AES_IV, CONF_DEVICE_ID, "serialNumber", "deviceID",
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant,  # noqa: ARG001
+    hass: HomeAssistant,
     entry: HCConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    # The description is included, so the dump can be set up again
+    entry_data = {
+        **entry.data,
+        CONF_DESCRIPTION: await get_description_store(hass).async_get(
+            entry.data[CONF_DESCRIPTION_HASH]
+        ),
+    }
     return {
-        "entry_data": async_redact_data(entry.data, TO_REDACT),
+        "entry_data": async_redact_data(entry_data, TO_REDACT),
         "appliance_state": entry.runtime_data.appliance.dump(),
+        "state_writes": entry.runtime_data.write_scheduler.as_dict(),
+        "value_writes": entry.runtime_data.write_batcher.as_dict(),
     }
@@ -0,0 +1,74 @@
+"""Zeroconf discovery cache."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CONF_MANUAL_HOST
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from . import HCConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time a changed IP has to be stable before the host is updated
+DISCOVERY_DEBOUNCE = 30
+
+
+@callback
+def async_update_host(hass: HomeAssistant, entry: HCConfigEntry, host: str) -> None:
+    """Update the host of a config entry, a loaded entry reconnects to it without a reload."""
+    _LOGGER.debug("Updating host of %s to %s", entry.title, host)
+    hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_HOST: host})
+
+
+class DiscoveryCache:
+    """
+    Track zeroconf announcements of configured appliances.
+
+    Announcements with an unchanged IP are ignored. A changed IP is applied once it was
+    stable for DISCOVERY_DEBOUNCE, a loaded appliance reconnects once to use it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._hosts: dict[str, str] = {}
+        self._pending: dict[str, CALLBACK_TYPE] = {}
+        self.ignored_announcements = 0
+        self.host_updates = 0
+
+    @callback
+    def async_discovered(self, entry: HCConfigEntry, host: str) -> None:
+        """Handle an announcement of a configured appliance."""
+        unique_id = entry.unique_id
+        if self._hosts.get(unique_id) == host:
+            self.ignored_announcements += 1
+            return
+        self._hosts[unique_id] = host
+        if cancel := self._pending.pop(unique_id, None):
+            cancel()
+        if host == entry.data.get(CONF_HOST):
+            return
+        _LOGGER.debug("Host of %s changed to %s", entry.title, host)
+
+        entry_id = entry.entry_id
+
+        @callback
+        def update_host(_: datetime) -> None:
+            self._pending.pop(unique_id, None)
+            entry = self._hass.config_entries.async_get_entry(entry_id)
+            if entry is None or entry.data.get(CONF_MANUAL_HOST, False):
+                return
+            self.host_updates += 1
+            async_update_host(self._hass, entry, host)
+
+        self._pending[unique_id] = async_call_later(self._hass, DISCOVERY_DEBOUNCE, update_host)
@@ -2,24 +2,26 @@
 
 from __future__ import annotations
 
-import asyncio
-import contextlib
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.entity import Entity
 
-from .helpers import entity_is_available
+from .helpers import get_availability_check
 
 if TYPE_CHECKING:
     from homeassistant.helpers.device_registry import DeviceInfo
     from homeconnect_websocket import HomeAppliance
     from homeconnect_websocket.entities import Entity as HcEntity
 
+    from .connection_monitor import ConnectionMonitor
     from .entity_descriptions.descriptions_definitions import (
         ExtraAttributeDict,
         HCEntityDescription,
     )
+    from .helpers import AvailabilityCheck
+    from .write_batcher import ValueWriteBatcher
+    from .write_scheduler import StateWriteScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,10 +31,16 @@ class HCEntity(Entity):
 
     entity_description: HCEntityDescription
     _attr_has_entity_name = True
-    _entity: HcEntity | None = None
+    _attr_should_poll = False
+    _available: bool
+    _availability_checks: tuple[AvailabilityCheck, ...]
+    _entity: HcEntity | None
     _entities: list[HcEntity]
-    _extra_attributes: list[ExtraAttributeDict]
-    _has_callback: bool = False
+    _extra_attributes: tuple[tuple[ExtraAttributeDict, HcEntity], ...]
+    _extra_attributes_cache: dict[str, Any] | None
+    _write_scheduler: StateWriteScheduler | None
+    _write_batcher: ValueWriteBatcher | None
+    _connection_monitor: ConnectionMonitor | None
 
     def __init__(
         self,
@@ -48,42 +56,88 @@ class HCEntity(Entity):
         if entity_description.translation_key is None:
             self._attr_translation_key = entity_description.key
 
+        self._write_scheduler = None
+        self._write_batcher = None
+        self._connection_monitor = None
+        self._entity = None
         self._entities = []
-        self._extra_attributes = []
+        self._extra_attributes = ()
+        self._extra_attributes_cache = None
+        self._available = False
+        self._availability_checks = ()
         if entity_description.entity:
             self._entity = self._appliance.entities[entity_description.entity]
             self._entities.append(self._appliance.entities[entity_description.entity])
+            self._add_availability_check(self._entity)
         if entity_description.entities:
             for entity_name in entity_description.entities:
                 self._entities.append(self._appliance.entities[entity_name])
         if entity_description.extra_attributes:
-            for extra_attribute in entity_description.extra_attributes:
-                if extra_attribute["entity"] in self._appliance.entities:
-                    self._extra_attributes.append(extra_attribute)
+            self._extra_attributes = tuple(
+                (extra_attribute, self._appliance.entities[extra_attribute["entity"]])
+                for extra_attribute in entity_description.extra_attributes
+                if extra_attribute["entity"] in self._appliance.entities
+            )
 
     async def async_added_to_hass(self) -> None:
-        for entity in self._entities:
+        runtime_data = self.platform.config_entry.runtime_data
+        self._write_scheduler = runtime_data.write_scheduler
+        self._write_batcher = runtime_data.write_batcher
+        for entity in self._get_subscribed_entities():
             entity.register_callback(self.callback)
+        self._connection_monitor = runtime_data.connection_monitor
+        self.async_on_remove(
+            self._connection_monitor.async_add_availability_listener(
+                self._async_availability_changed
+            )
+        )
+        self._update_available()
 
     async def async_will_remove_from_hass(self) -> None:
-        for entity in self._entities:
+        for entity in self._get_subscribed_entities():
             entity.unregister_callback(self.callback)
+        if self._write_scheduler is not None:
+            self._write_scheduler.async_discard(self)
+
+    def _get_subscribed_entities(self) -> list[HcEntity]:
+        """Get the HC entities to subscribe, including the extra attribute sources."""
+        entities = list(self._entities)
+        for _, entity in self._extra_attributes:
+            if entity not in entities:
+                entities.append(entity)
+        return entities
+
+    def _add_availability_check(self, entity: HcEntity) -> None:
+        """Add a HC entity the availability depends on."""
+        self._availability_checks = (*self._availability_checks, get_availability_check(entity))
+
+    def _update_available(self) -> None:
+        """Compute the HC entity availability, called on HC entity updates."""
+        available = True
+        available_access = self.entity_description.available_access
+        for entity, has_available, has_access in self._availability_checks:
+            if has_available:
+                available &= bool(entity.available)
+            if has_access:
+                available &= entity.access in available_access
+        self._available = available
 
     @property
     def available(self) -> bool:
-        available = (
-            self._appliance.session.connected
-            # Hide first reconnect
-            or (not self._appliance.session.connected and self._appliance.session.retry_count <= 2)
-        )
-        available &= entity_is_available(self._entity, self.entity_description.available_access)
-        return available
+        if self._connection_monitor is not None and not self._connection_monitor.available:
+            # Not connected yet or the reconnect grace time passed
+            return False
+        return self._available
 
     @property
     def extra_state_attributes(self) -> dict:
+        if self._extra_attributes_cache is None:
+            self._extra_attributes_cache = self._get_extra_attributes()
+        return self._extra_attributes_cache
+
+    def _get_extra_attributes(self) -> dict[str, Any]:
         extra_state_attributes = {}
-        for description in self._extra_attributes:
-            entity = self._appliance.entities[description["entity"]]
+        for description, entity in self._extra_attributes:
             if "value_fn" in description:
                 try:
                     extra_state_attributes[description["name"]] = description["value_fn"](entity)
@@ -100,11 +154,26 @@ class HCEntity(Entity):
                 extra_state_attributes[description["name"]] = entity.value
         return extra_state_attributes
 
-    async def callback(self, _: HcEntity) -> None:
-        if not self._has_callback:
-            self._has_callback = True
-            if not self._appliance.session.connected:
-                with contextlib.suppress(TimeoutError):
-                    await asyncio.wait_for(self._appliance.session.connected_event.wait(), 10)
+    async def callback(self, entity: HcEntity) -> None:
+        if any(entity is source for _, source in self._extra_attributes):
+            self._extra_attributes_cache = None
+        self._update_available()
+        self.async_schedule_write_ha_state()
+
+    def _async_availability_changed(self) -> None:
+        # Written directly, the write scheduler holds writes while disconnected
+        self.async_write_ha_state()
+
+    def async_schedule_write_ha_state(self) -> None:
+        """Write state on the next loop iteration or after reconnecting."""
+        if self._write_scheduler is not None:
+            self._write_scheduler.async_schedule_write(self)
+        else:
             self.async_write_ha_state()
-            self._has_callback = False
+
+    async def _async_set_value(self, value: Any) -> None:
+        """Set the value of the HC entity, batched with other writes to the appliance."""
+        if self._write_batcher is not None:
+            await self._write_batcher.async_set_value(self._entity, value)
+        else:
+            await self._entity.set_value(value)
@@ -2,13 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from custom_components.homeconnect_ws.helpers import merge_dicts
-
-from .common import COMMON_ENTITY_DESCRIPTIONS
-from .consumer_products import CONSUMER_PRODUCTS_ENTITY_DESCRIPTIONS
-from .cooking import COOKING_ENTITY_DESCRIPTIONS
 from .descriptions_definitions import (
     EntityDescriptions,
     HCBinarySensorEntityDescription,
@@ -20,29 +17,203 @@ from .descriptions_definitions import (
     HCSelectEntityDescription,
     HCSensorEntityDescription,
     HCSwitchEntityDescription,
+    _EntityDescriptionsCatalogueType,
     _EntityDescriptionsDefinitionsType,
     _EntityDescriptionsType,
 )
-from .dishcare import DISHCARE_ENTITY_DESCRIPTIONS
-from .laundry_care import LAUNDRY_ENTITY_DESCRIPTIONS
-from .refrigeration import REFRIGERATION_ENTITY_DESCRIPTIONS
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
     from homeconnect_websocket import HomeAppliance
 
 
-ALL_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType | None = None
+class DescriptionFamily(NamedTuple):
+    """Module with the Entity descriptions of an appliance family."""
+
+    name: str
+    attribute: str
+    # Loaded for appliances with entities in this namespace, None to always load
+    namespace: str | None
+
+
+DESCRIPTION_FAMILIES: tuple[DescriptionFamily, ...] = (
+    DescriptionFamily("common", "COMMON_ENTITY_DESCRIPTIONS", None),
+    DescriptionFamily("cooking", "COOKING_ENTITY_DESCRIPTIONS", "Cooking"),
+    DescriptionFamily("dishcare", "DISHCARE_ENTITY_DESCRIPTIONS", "Dishcare"),
+    DescriptionFamily("laundry_care", "LAUNDRY_ENTITY_DESCRIPTIONS", "LaundryCare"),
+    DescriptionFamily("refrigeration", "REFRIGERATION_ENTITY_DESCRIPTIONS", "Refrigeration"),
+    DescriptionFamily(
+        "consumer_products", "CONSUMER_PRODUCTS_ENTITY_DESCRIPTIONS", "ConsumerProducts"
+    ),
+)
+_FAMILY_RANKS = {family.name: rank for rank, family in enumerate(DESCRIPTION_FAMILIES)}
+
+# Catalogue positions of a family start at rank * FAMILY_POSITION_OFFSET
+FAMILY_POSITION_OFFSET = 100_000
+
+
+def get_families(appliance_entities: Iterable[str]) -> list[str]:
+    """Get the description families for the given HC entities."""
+    namespaces = {entity_name.partition(".")[0] for entity_name in appliance_entities}
+    return [
+        family.name
+        for family in DESCRIPTION_FAMILIES
+        if family.namespace is None or family.namespace in namespaces
+    ]
+
+
+def get_family_descriptions(family: str) -> _EntityDescriptionsDefinitionsType:
+    """Import the descriptions of a family."""
+    module = importlib.import_module(f"{__name__}.{family}")
+    return getattr(module, DESCRIPTION_FAMILIES[_FAMILY_RANKS[family]].attribute)
+
+
+def build_catalogue(
+    *definitions: _EntityDescriptionsDefinitionsType,
+) -> _EntityDescriptionsCatalogueType:
+    """
+    Merge description definitions into an immutable catalogue.
+
+    Duplicates equal to an earlier description with the same key are dropped, descriptions
+    with the same key but different entities are kept as alternatives.
+    """
+    catalogue: dict[str, list] = {}
+    variants: dict[str, list[HCEntityDescription]] = {}
+    for definition in definitions:
+        for description_type, descriptions in definition.items():
+            merged = catalogue.setdefault(description_type, [])
+            for description in descriptions:
+                if not callable(description):
+                    key_variants = variants.setdefault(description.key, [])
+                    if description in key_variants:
+                        continue
+                    key_variants.append(description)
+                merged.append(description)
+    return MappingProxyType(
+        {description_type: tuple(merged) for description_type, merged in catalogue.items()}
+    )
+
+
+_ALL_ENTITY_DESCRIPTIONS: _EntityDescriptionsCatalogueType | None = None
+
+
+def get_all_entity_description() -> _EntityDescriptionsCatalogueType:
+    """Get the catalogue of all families, this imports every family."""
+    global _ALL_ENTITY_DESCRIPTIONS  # noqa: PLW0603
+    if _ALL_ENTITY_DESCRIPTIONS is None:
+        _ALL_ENTITY_DESCRIPTIONS = build_catalogue(
+            *(get_family_descriptions(family.name) for family in DESCRIPTION_FAMILIES)
+        )
+    return _ALL_ENTITY_DESCRIPTIONS
+
+
+class IndexedDescription(NamedTuple):
+    """Static Entity description with the HC entities it requires."""
+
+    position: int
+    description_type: str
+    description: HCEntityDescription
+    required_entities: frozenset[str]
+
+
+class DescriptionIndex:
+    """Inverted index of static Entity descriptions by required HC entity."""
+
+    def __init__(
+        self,
+        all_descriptions: _EntityDescriptionsDefinitionsType | _EntityDescriptionsCatalogueType,
+        position_offset: int = 0,
+    ) -> None:
+        self.by_entity: dict[str, list[IndexedDescription]] = {}
+        self.unconditional: list[IndexedDescription] = []
+        self.static: dict[int, IndexedDescription] = {}
+        self.positions: dict[int, int] = {}
+        # static descriptions by type, key and required entities, stable across versions
+        self.references: dict[tuple[str, str, frozenset[str]], list[IndexedDescription]] = {}
+        self.generators: list[tuple[int, str, Callable]] = []
+        position = position_offset
+        for description_type, descriptions in all_descriptions.items():
+            for description in descriptions:
+                position += 1
+                if callable(description):
+                    self.generators.append((position, description_type, description))
+                    continue
+                required_entities = set()
+                if description.entity:
+                    required_entities.add(description.entity)
+                if description.entities:
+                    required_entities.update(description.entities)
+                indexed = IndexedDescription(
+                    position, description_type, description, frozenset(required_entities)
+                )
+                self.static[position] = indexed
+                self.positions[id(description)] = position
+                self.references.setdefault(
+                    (description_type, description.key, indexed.required_entities), []
+                ).append(indexed)
+                if required_entities:
+                    # index on one required entity, the others are checked on lookup
+                    self.by_entity.setdefault(min(required_entities), []).append(indexed)
+                else:
+                    self.unconditional.append(indexed)
+
+    def lookup(self, appliance_entities: Mapping[str, Any]) -> list[IndexedDescription]:
+        """Get all static descriptions available with the given HC entities."""
+        matches = list(self.unconditional)
+        by_entity = self.by_entity
+        for entity_name in appliance_entities:
+            if candidates := by_entity.get(entity_name):
+                matches.extend(
+                    candidate
+                    for candidate in candidates
+                    if all(entity in appliance_entities for entity in candidate.required_entities)
+                )
+        return matches
+
 
+_FAMILY_INDEXES: dict[str, tuple[_EntityDescriptionsDefinitionsType, DescriptionIndex]] = {}
 
-def get_all_entity_description() -> _EntityDescriptionsDefinitionsType:
-    global ALL_ENTITY_DESCRIPTIONS  # noqa: PLW0603
-    if ALL_ENTITY_DESCRIPTIONS is None:
-        ALL_ENTITY_DESCRIPTIONS = merge_dicts(
-            COMMON_ENTITY_DESCRIPTIONS,
-            COOKING_ENTITY_DESCRIPTIONS,
-            DISHCARE_ENTITY_DESCRIPTIONS,
+
+def get_family_index(family: str) -> DescriptionIndex:
+    """Get the description index of a family, the family is imported on first use."""
+    descriptions = get_family_descriptions(family)
+    cached = _FAMILY_INDEXES.get(family)
+    if cached is None or cached[0] is not descriptions:
+        index = DescriptionIndex(
+            build_catalogue(descriptions), _FAMILY_RANKS[family] * FAMILY_POSITION_OFFSET
         )
-    return ALL_ENTITY_DESCRIPTIONS
+        cached = _FAMILY_INDEXES[family] = (descriptions, index)
+    return cached[1]
+
+
+def get_static_description(reference: Mapping[str, Any]) -> HCEntityDescription:
+    """Get a static description by its reference, raises KeyError if it isn't unique."""
+    index = get_family_index(reference["family"])
+    matches = index.references.get(
+        (reference["type"], reference["key"], frozenset(reference["entities"])), []
+    )
+    if len(matches) != 1:
+        msg = f"No unique static description for {reference['key']}"
+        raise KeyError(msg)
+    return matches[0].description
+
+
+def get_static_reference(description: HCEntityDescription) -> dict[str, Any] | None:
+    """Get the reference of a unique static description from a loaded family."""
+    for family, (_, index) in _FAMILY_INDEXES.items():
+        if (position := index.positions.get(id(description))) is not None:
+            indexed = index.static[position]
+            reference = (indexed.description_type, description.key, indexed.required_entities)
+            if len(index.references[reference]) != 1:
+                return None
+            return {
+                "family": family,
+                "type": indexed.description_type,
+                "key": description.key,
+                "entities": sorted(indexed.required_entities),
+            }
+    return None
 
 
 def get_available_entities(appliance: HomeAppliance) -> EntityDescriptions:
@@ -62,27 +233,31 @@ def get_available_entities(appliance: HomeAppliance) -> EntityDescriptions:
         "light": [],
         "fan": [],
     }
-    appliance_entities = set(appliance.entities)
-    for description_type, descriptions in get_all_entity_description().items():
-        # dynamic descriptions
-        if description_type == "dynamic":
-            for descriptions_fn in descriptions:
+    matches: list[tuple[int, str, HCEntityDescription]] = []
+    for family in get_families(appliance.entities):
+        index = get_family_index(family)
+        matches.extend(
+            (indexed.position, indexed.description_type, indexed.description)
+            for indexed in index.lookup(appliance.entities)
+        )
+        for position, description_type, descriptions_fn in index.generators:
+            # dynamic descriptions
+            if description_type == "dynamic":
                 dynamic_descriptions: _EntityDescriptionsType = descriptions_fn(appliance)
                 for key, value in dynamic_descriptions.items():
-                    available_entities[key].extend(value)
+                    matches.extend((position, key, description) for description in value)
+            elif dynamic_description := descriptions_fn(appliance):
+                matches.append((position, description_type, dynamic_description))
+
+    # keep catalogue order, sort is stable for descriptions from the same generator
+    matches.sort(key=lambda match: match[0])
+    keys = set()
+    for _, description_type, description in matches:
+        # only the first available alternative of a key is used
+        if description.key in keys:
             continue
-        for description in descriptions:
-            if callable(description):
-                if dynamic_description := description(appliance):
-                    available_entities[description_type].append(dynamic_description)
-            else:
-                all_subscribed_entities = set()
-                if description.entity:
-                    all_subscribed_entities.add(description.entity)
-                if description.entities:
-                    all_subscribed_entities.update(description.entities)
-                if appliance_entities.issuperset(all_subscribed_entities):
-                    available_entities[description_type].append(description)
+        keys.add(description.key)
+        available_entities[description_type].append(description)
     return available_entities
 
 
@@ -20,9 +20,10 @@ from homeassistant.const import (
     EntityCategory,
     UnitOfTime,
 )
-from custom_components.homeconnect_ws.helpers import get_all_programs
 from homeconnect_websocket.entities import Execution
 
+from custom_components.homeconnect_ws.program_catalogue import ProgramCatalogue
+
 from .descriptions_definitions import (
     EntityDescriptions,
     HCBinarySensorEntityDescription,
@@ -116,18 +117,18 @@ def generate_door_state(appliance: HomeAppliance) -> HCSensorEntityDescription |
 
 
 def generate_program(appliance: HomeAppliance) -> EntityDescriptions:
-    """Get Door program select and sensor description."""
-    programs, sorted_programs = get_all_programs(appliance)
+    """Get program select and sensor description."""
+    catalogue = ProgramCatalogue.from_appliance(appliance)
 
     descriptions = EntityDescriptions()
-    if programs:
+    if catalogue:
         descriptions["active_program"] = [
             HCSensorEntityDescription(
                 key="sensor_active_program",
                 entity="BSH.Common.Root.ActiveProgram",
                 device_class=SensorDeviceClass.ENUM,
                 has_state_translation=False,
-                mapping=sorted_programs,
+                mapping=catalogue,
             )
         ]
         descriptions["program"] = [
@@ -135,7 +136,7 @@ def generate_program(appliance: HomeAppliance) -> EntityDescriptions:
                 key="select_program",
                 entity="BSH.Common.Root.SelectedProgram",
                 has_state_translation=False,
-                mapping=sorted_programs,
+                mapping=catalogue,
             )
         ]
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 import sys
 from typing import TYPE_CHECKING
 
@@ -16,7 +15,7 @@ from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTemperature, UnitOfTime
 
-from custom_components.homeconnect_ws.helpers import get_groups_from_regex, get_all_programs
+from custom_components.homeconnect_ws.helpers import get_entity_tree
 
 from .descriptions_definitions import (
     EntityDescriptions,
@@ -41,8 +40,7 @@ def add_if_entity_exists(appliance: HomeAppliance, list: Any, to_add: Any) -> No
 
 def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
     """Get Oven status descriptions."""
-    pattern = re.compile(r"^Cooking\.Oven\.Status\.Cavity\.(\d+)\..*$")
-    groups = get_groups_from_regex(appliance, pattern)
+    groups = get_entity_tree(appliance).get_groups("Cooking.Oven.Status.Cavity")
     
     descriptions = EntityDescriptions(event_sensor=[], sensor=[], number=[], switch=[], select=[], binary_sensor=[])
     add_if_entity_exists(
@@ -72,10 +70,10 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
 
     for group in groups:
         group_key = ""
-        if int(group[0]) == 230:
+        if int(group) == 230:
             group_key = "upper"
             group_name = "Upper "
-        if int(group[0]) == 140:
+        if int(group) == 140:
             group_key = "lower"
             group_name = "Lower "
 
@@ -86,7 +84,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"binary_sensor_oven_{group_key}_meatprobe_plugged",
                 translation_key="binary_sensor_oven_meatprobe_plugged",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.MeatprobePlugged",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.MeatprobePlugged",
                 entity_category=EntityCategory.DIAGNOSTIC
             )
         )
@@ -98,7 +96,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_current_meatprobe_temperature",
                 translation_key="sensor_oven_current_meatprobe_temperature",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.CurrentMeatprobeTemperatureFahrenheit",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.CurrentMeatprobeTemperatureFahrenheit",
                 device_class=SensorDeviceClass.TEMPERATURE,
                 native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
             )
@@ -111,7 +109,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_setpoint_meatprobe_temperature",
                 translation_key="sensor_oven_setpoint_meatprobe_temperature",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.MeatProbeTemperatureFahrenheit",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.MeatProbeTemperatureFahrenheit",
                 device_class=SensorDeviceClass.TEMPERATURE,
                 native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
             )
@@ -124,7 +122,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_regular_preheat",
                 translation_key="sensor_regular_preheat_finished",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Event.Cavity.{group[0]}.RegularPreheatFinished",
+                entity=f"Cooking.Oven.Event.Cavity.{group}.RegularPreheatFinished",
                 device_class=SensorDeviceClass.ENUM,
                 has_state_translation=True,
                 options=["off","present","confirmed"]
@@ -138,7 +136,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_rfast_preheat",
                 translation_key="sensor_fast_preheat_finished",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Event.Cavity.{group[0]}.FastPreheatFinished",
+                entity=f"Cooking.Oven.Event.Cavity.{group}.FastPreheatFinished",
                 device_class=SensorDeviceClass.ENUM,
                 has_state_translation=True,
                 options=["off","present","confirmed"]
@@ -150,7 +148,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
             descriptions["switch"],
             HCSwitchEntityDescription(
                 key=f"select_oven_{group_key}_light_power",
-                entity=f"Cooking.Oven.Setting.Light.Cavity.{group[0]}.Power",
+                entity=f"Cooking.Oven.Setting.Light.Cavity.{group}.Power",
                 translation_key="select_light_specific",
                 translation_placeholders={"group_name": group_name},
                 device_class=SwitchDeviceClass.SWITCH,
@@ -164,7 +162,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_cavity_state",
                 translation_key="sensor_oven_cavity_state",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.State",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.State",
                 device_class=SensorDeviceClass.ENUM,
                 has_state_translation=True,
             )
@@ -177,7 +175,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_current_temperature",
                 translation_key="sensor_oven_current_temperature",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.CurrentTemperatureFahrenheit",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.CurrentTemperatureFahrenheit",
                 device_class=SensorDeviceClass.TEMPERATURE,
                 native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
             )
@@ -203,7 +201,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_setpoint_temperature",
                 translation_key="sensor_oven_setpoint_temperature",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.SetpointTemperatureFahrenheit",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.SetpointTemperatureFahrenheit",
                 device_class=SensorDeviceClass.TEMPERATURE,
                 native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
             )
@@ -216,7 +214,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_door_state",
                 translation_key="sensor_door_state_specific",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.DoorState",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.DoorState",
                 device_class=SensorDeviceClass.ENUM,
                 has_state_translation=True,
             )
@@ -229,7 +227,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_operation_state",
                 translation_key="sensor_operation_state_specific",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.OperationState",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.OperationState",
                 device_class=SensorDeviceClass.ENUM,
                 has_state_translation=True,
             )
@@ -242,7 +240,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_active_program",
                 translation_key="sensor_active_program_specific",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.ActiveProgram",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.ActiveProgram",
                 has_state_translation=False,
             )
         )
@@ -254,7 +252,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_selected_program",
                 translation_key="sensor_selected_program_specific",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.SelectedProgram",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.SelectedProgram",
                 has_state_translation=False,
             )
         )
@@ -266,7 +264,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_elapsed_program_time",
                 translation_key="sensor_oven_elapsed_program_time",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.ElapsedProgramTime",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.ElapsedProgramTime",
                 device_class=SensorDeviceClass.DURATION,
                 native_unit_of_measurement=UnitOfTime.SECONDS,
                 suggested_unit_of_measurement=UnitOfTime.HOURS,
@@ -280,7 +278,7 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
                 key=f"sensor_oven_{group_key}_remaining_program_time",
                 translation_key="sensor_oven_remaining_program_time",
                 translation_placeholders={"group_name": group_name},
-                entity=f"Cooking.Oven.Status.Cavity.{group[0]}.RemainingProgramTime",
+                entity=f"Cooking.Oven.Status.Cavity.{group}.RemainingProgramTime",
                 device_class=SensorDeviceClass.DURATION,
                 native_unit_of_measurement=UnitOfTime.SECONDS,
                 suggested_unit_of_measurement=UnitOfTime.HOURS,
@@ -292,20 +290,19 @@ def generate_oven_status(appliance: HomeAppliance) -> [EntityDescriptions]:
 
 def generate_oven_event(appliance: HomeAppliance) -> EntityDescriptions:
     """Get Oven event descriptions."""
-    pattern = re.compile(r"^Cooking\.Oven\.Event\.Cavity\.([0-9]*)\..*$")
-    groups = get_groups_from_regex(appliance, pattern)
+    groups = get_entity_tree(appliance).get_groups("Cooking.Oven.Event.Cavity")
     descriptions = EntityDescriptions(binary_sensor=[])
     for group in groups:
-        group_name = f" {int(group[0])}"
+        group_name = f" {int(group)}"
         if len(groups) == 1:
             group_name = ""
 
         # AlarmClockElapsed
-        entity = f"Cooking.Oven.Event.Cavity.{group[0]}.AlarmClockElapsed"
+        entity = f"Cooking.Oven.Event.Cavity.{group}.AlarmClockElapsed"
         if entity in appliance.entities:
             descriptions["binary_sensor"].append(
                 HCBinarySensorEntityDescription(
-                    key=f"binary_sensor_oven_alarm_clock_elapsed_{group[0]}",
+                    key=f"binary_sensor_oven_alarm_clock_elapsed_{group}",
                     translation_key="binary_sensor_oven_alarm_clock_elapsed",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -319,18 +316,17 @@ def generate_oven_event(appliance: HomeAppliance) -> EntityDescriptions:
 
 def generate_oven_settings(appliance: HomeAppliance) -> HCFanEntityDescription:
     """Get Oven status descriptions."""
-    pattern = re.compile(r"^Cooking\.Oven\.Setting\.Cavity\.([0-9]*)\..*$")
-    groups = get_groups_from_regex(appliance, pattern)
+    groups = get_entity_tree(appliance).get_groups("Cooking.Oven.Setting.Cavity")
     descriptions = EntityDescriptions(number=[])
     for group in groups:
-        group_name = f" {int(group[0])}"
+        group_name = f" {int(group)}"
 
         # AlarmClock
-        entity = f"Cooking.Oven.Setting.Cavity.{group[0]}.AlarmClock"
+        entity = f"Cooking.Oven.Setting.Cavity.{group}.AlarmClock"
         if entity in appliance.entities:
             descriptions["number"].append(
                 HCNumberEntityDescription(
-                    key=f"number_oven_setting_{group[0]}_alarm_clock",
+                    key=f"number_oven_setting_{group}_alarm_clock",
                     translation_key="number_oven_setting_alarm_clock",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -360,18 +356,17 @@ def generate_hood_fan(appliance: HomeAppliance) -> HCFanEntityDescription:
 
 def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
     """Get Oven status descriptions."""
-    pattern = re.compile(r"^Cooking\.Hob\.Status\.Zone\.([0-9]*)\..*$")
-    groups = get_groups_from_regex(appliance, pattern)
+    groups = get_entity_tree(appliance).get_groups("Cooking.Hob.Status.Zone")
     descriptions = EntityDescriptions(sensor=[])
     for group in groups:
-        group_name = f" {int(group[0])}"
+        group_name = f" {int(group)}"
 
         # State
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.State"
+        entity = f"Cooking.Hob.Status.Zone.{group}.State"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_state",
+                    key=f"sensor_hob_zone_{group}_state",
                     translation_key="sensor_hob_zone_state",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -380,18 +375,18 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
                     extra_attributes=[
                         {
                             "name": "Type",
-                            "entity": f"Cooking.Hob.Status.Zone.{group[0]}.Type",
+                            "entity": f"Cooking.Hob.Status.Zone.{group}.Type",
                         }
                     ],
                 )
             )
 
         # OperationState
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.OperationState"
+        entity = f"Cooking.Hob.Status.Zone.{group}.OperationState"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_operationstate",
+                    key=f"sensor_hob_zone_{group}_operationstate",
                     translation_key="sensor_hob_zone_operationstate",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -401,11 +396,11 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # PowerLevel
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.PowerLevel"
+        entity = f"Cooking.Hob.Status.Zone.{group}.PowerLevel"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_power_level",
+                    key=f"sensor_hob_zone_{group}_power_level",
                     translation_key="sensor_hob_zone_power_level",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -415,11 +410,11 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # FryingSensorLevel
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.FryingSensorLevel"
+        entity = f"Cooking.Hob.Status.Zone.{group}.FryingSensorLevel"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_frying_sensor_level",
+                    key=f"sensor_hob_zone_{group}_frying_sensor_level",
                     translation_key="sensor_hob_zone_frying_sensor_level",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -429,11 +424,11 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # CurrentTemperature
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.CurrentTemperature"
+        entity = f"Cooking.Hob.Status.Zone.{group}.CurrentTemperature"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_current_temperature",
+                    key=f"sensor_hob_zone_{group}_current_temperature",
                     translation_key="sensor_hob_zone_current_temperature",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -443,11 +438,11 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # HeatupProgress
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.HeatupProgress"
+        entity = f"Cooking.Hob.Status.Zone.{group}.HeatupProgress"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_heatup_progress",
+                    key=f"sensor_hob_zone_{group}_heatup_progress",
                     translation_key="sensor_hob_zone_heatup_progress",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -456,11 +451,11 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # Duration
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.Duration"
+        entity = f"Cooking.Hob.Status.Zone.{group}.Duration"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_duration",
+                    key=f"sensor_hob_zone_{group}_duration",
                     translation_key="sensor_hob_zone_duration",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -471,12 +466,12 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # ElapsedProgramTime
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.ElapsedProgramTime"
-        extra_entity = f"Cooking.Hob.Status.Zone.{group[0]}.ElapsedProgramTime.AutoCounting"
+        entity = f"Cooking.Hob.Status.Zone.{group}.ElapsedProgramTime"
+        extra_entity = f"Cooking.Hob.Status.Zone.{group}.ElapsedProgramTime.AutoCounting"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_elapsed_program_time",
+                    key=f"sensor_hob_zone_{group}_elapsed_program_time",
                     translation_key="sensor_hob_zone_elapsed_program_time",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -488,12 +483,12 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # RemainingProgramTime
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.RemainingProgramTime"
-        extra_entity = f"Cooking.Hob.Status.Zone.{group[0]}.RemainingProgramTime.AutoCounting"
+        entity = f"Cooking.Hob.Status.Zone.{group}.RemainingProgramTime"
+        extra_entity = f"Cooking.Hob.Status.Zone.{group}.RemainingProgramTime.AutoCounting"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_remaining_program_time",
+                    key=f"sensor_hob_zone_{group}_remaining_program_time",
                     translation_key="sensor_hob_zone_remaining_program_time",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -505,11 +500,11 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # ProgramProgress
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.ProgramProgress"
+        entity = f"Cooking.Hob.Status.Zone.{group}.ProgramProgress"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_program_progress",
+                    key=f"sensor_hob_zone_{group}_program_progress",
                     translation_key="sensor_hob_zone_program_progress",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
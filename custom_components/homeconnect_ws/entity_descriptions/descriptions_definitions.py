@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Literal, NotRequired, TypedDict
 
 from homeassistant.components.binary_sensor import BinarySensorEntityDescription
@@ -46,7 +46,7 @@ class HCSelectEntityDescription(
 
     available_access: tuple[Access] = (Access.READ_WRITE, Access.WRITE_ONLY)
     has_state_translation: bool = False
-    mapping: dict[str, str] = None
+    mapping: Mapping[str, str] = None
 
 
 class HCSwitchEntityDescription(
@@ -65,7 +65,7 @@ class HCSensorEntityDescription(
 
     available_access: tuple[Access] = (Access.READ, Access.READ_WRITE)
     has_state_translation: bool = False
-    mapping: dict[str, str] = None
+    mapping: Mapping[str, str] = None
 
 
 class HCBinarySensorEntityDescription(
@@ -153,6 +153,16 @@ _EntityDescriptionsDefinitionsType = dict[
     ],
 ]
 
+# Immutable catalogue built from _EntityDescriptionsDefinitionsType
+_EntityDescriptionsCatalogueType = Mapping[
+    str,
+    tuple[
+        HCEntityDescription
+        | Callable[[HomeAppliance], HCEntityDescription | EntityDescriptions | None],
+        ...,
+    ],
+]
+
 _EntityDescriptionsType = dict[
     Literal[
         "button",
@@ -51,6 +51,9 @@ class HCFan(HCEntity, FanEntity):
     _speed_entities: dict[str, HcEntity] | None = None
     _speed_range: range = None
     _speed_mapping: list[SpeedMapping]
+    _speed_by_value: dict[tuple[str, int], int]
+    _payload_by_speed: dict[int, list[dict[str, int]]]
+    _off_payload: list[dict[str, int]]
 
     def __init__(
         self,
@@ -79,43 +82,48 @@ class HCFan(HCEntity, FanEntity):
 
         self._speed_range = (1, self._attr_speed_count)
 
+        # Lookup tables (entity name, raw value) -> speed and speed -> payload
+        self._speed_by_value = {}
+        self._payload_by_speed = {}
+        self._off_payload = [
+            {"uid": entity.uid, "value": 0} for entity in self._speed_entities.values()
+        ]
+        for speed in self._speed_mapping:
+            self._speed_by_value.setdefault((speed.entity_name, speed.entity_value), speed.speed)
+            self._payload_by_speed[speed.speed] = [
+                {
+                    "uid": entity.uid,
+                    "value": speed.entity_value if entity_name == speed.entity_name else 0,
+                }
+                for entity_name, entity in self._speed_entities.items()
+            ]
+
     @property
     def percentage(self) -> int | None:
-        for speed in self._speed_mapping:
-            if self._speed_entities[speed.entity_name].value_raw == speed.entity_value:
-                return ranged_value_to_percentage(self._speed_range, speed.speed)
+        for entity_name, entity in self._speed_entities.items():
+            speed = self._speed_by_value.get((entity_name, entity.value_raw))
+            if speed is not None:
+                return ranged_value_to_percentage(self._speed_range, speed)
         return 0
 
     async def async_set_percentage(self, percentage: int) -> None:
         new_speed = math.ceil(percentage_to_ranged_value(self._speed_range, percentage))
-        new_speed_entity: str = None
-        new_speed_value: int = None
-        for speed in self._speed_mapping:
-            if speed.speed == new_speed:
-                new_speed_entity = speed.entity_name
-                new_speed_value = speed.entity_value
-        if new_speed_entity or new_speed == 0:
-            data = []
-            for entity in self._speed_entities.values():
-                if entity.name == new_speed_entity:
-                    data.append({"uid": entity.uid, "value": new_speed_value})
-                else:
-                    data.append({"uid": entity.uid, "value": 0})
-            message = Message(
-                resource="/ro/values",
-                action=Action.POST,
-                data=data,
-            )
-            await self._appliance.session.send_sync(message)
-        else:
+        if new_speed == 0:
+            data = self._off_payload
+        elif (data := self._payload_by_speed.get(new_speed)) is None:
             msg = f"Speed {percentage} is invalid"
             raise ServiceValidationError(msg)
+        message = Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=data,
+        )
+        await self._appliance.session.send_sync(message)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        data = [{"uid": entity.uid, "value": 0} for entity in self._speed_entities.values()]
         message = Message(
             resource="/ro/values",
             action=Action.POST,
-            data=data,
+            data=self._off_payload,
         )
         await self._appliance.session.send_sync(message)
@@ -2,29 +2,35 @@
 
 from __future__ import annotations
 
-import re
 import logging
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import sys
+import weakref
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from homeassistant.const import Platform
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.service import async_extract_config_entry_ids
 
-from custom_components.homeconnect_ws.const import DOMAIN
+from custom_components.homeconnect_ws.const import DOMAIN, PLATFORM_DESCRIPTION_TYPES, PLATFORMS
 
 if TYPE_CHECKING:
-    import re
+    from collections.abc import Iterable, Mapping
 
     from homeassistant.core import HomeAssistant, ServiceCall
     from homeconnect_websocket import HomeAppliance
-    from homeconnect_websocket.entities import Access
     from homeconnect_websocket.entities import Entity as HcEntity
 
     from . import HCConfigEntry, HCData
     from .entity import HCEntity
+    from .entity_descriptions import _EntityDescriptionsType
 
 _LOGGER = logging.getLogger(__name__)
 
+REDACTED = "**REDACTED**"
+# Last token of HC entity names with identifying values
+SNAPSHOT_REDACT = {"DeviceID", "MacAddress", "SerialNumber"}
+
 
 def create_entities(
     entities_classes: dict[str, type[HCEntity]], runtime_data: HCData
@@ -48,68 +54,116 @@ def create_entities(
     return entities
 
 
-def merge_dicts(*args: dict[str, list]) -> dict[str, list]:
-    """Merge multiple dictionaries of type dict[str, list]."""
-    out_dict: dict[str, list] = {}
-    for in_dict in args:
-        for key, value in in_dict.items():
-            if key not in out_dict:
-                out_dict[key] = value
-            else:
-                out_dict[key].extend(value)
-    return out_dict
-
-
-@dataclass
-class EntityMatch:
-    """Returned by get_entities_from_regex."""
-
-    entity: str
-    groups: tuple[str]
-
-
-def get_entities_from_regex(appliance: HomeAppliance, pattern: re.Pattern) -> list[EntityMatch]:
-    """Get all entities matching the pattern."""
+def get_required_platforms(available_entities: _EntityDescriptionsType) -> list[Platform]:
+    """Get the platforms with at least one description, binary_sensor is always required."""
     return [
-        EntityMatch(entity=entity, groups=match.groups())
-        for entity in appliance.entities
-        if (match := pattern.match(entity))
+        platform
+        for platform in PLATFORMS
+        if platform == Platform.BINARY_SENSOR
+        or any(available_entities.get(key) for key in PLATFORM_DESCRIPTION_TYPES[platform])
     ]
 
 
-def get_groups_from_regex(appliance: HomeAppliance, pattern: re.Pattern) -> set[tuple[str]]:
-    """Get all regex groups matching the pattern."""
-    groups = set()
-    for entity in appliance.entities:
-        if (match := pattern.match(entity)) and match.groups() not in groups:
-            groups.add(match.groups())
-    return groups
-
-def get_all_programs(appliance: HomeAppliance) -> Any:
-    pattern = re.compile(r"^BSH\.Common\.Program\.Favorite\.(.*)$")
-
-    programs = {}
-
-    for program in appliance.programs:
-        if match := pattern.match(program):
-            favorite_name_entity = appliance.settings.get(
-                f"BSH.Common.Setting.Favorite.{match.groups()[0]}.Name"
-            )
-            if favorite_name_entity and favorite_name_entity.value:
-                program_name = favorite_name_entity.value
-            else:
-                program_name = f"favorite_{match.groups()[0]}"
+class EntityTreeNode:
+    """Node of the EntityTree."""
+
+    __slots__ = ("children", "is_entity")
+
+    def __init__(self) -> None:
+        self.children: dict[str, EntityTreeNode] = {}
+        self.is_entity = False
+
+
+class EntityTree:
+    """Prefix trie of HC entity names, tokenized on '.'."""
+
+    def __init__(self, entity_names: Iterable[str]) -> None:
+        self.root = EntityTreeNode()
+        for entity_name in entity_names:
+            node = self.root
+            for token in entity_name.split("."):
+                child = node.children.get(token)
+                if child is None:
+                    child = node.children[token] = EntityTreeNode()
+                node = child
+            node.is_entity = True
+
+    def get_node(self, prefix: str) -> EntityTreeNode | None:
+        """Get the node for a prefix."""
+        node = self.root
+        for token in prefix.split("."):
+            node = node.children.get(token)
+            if node is None:
+                return None
+        return node
+
+    def get_groups(self, prefix: str, *, numeric: bool = True) -> list[str]:
+        """
+        Get all tokens following the prefix that have entities below them.
+
+        For example "Cooking.Oven.Status.Cavity" returns ["001", "002"]
+        for "Cooking.Oven.Status.Cavity.001.State" and "Cooking.Oven.Status.Cavity.002.State".
+        """
+        node = self.get_node(prefix)
+        if node is None:
+            return []
+        return [
+            token
+            for token, child in node.children.items()
+            if child.children and (not numeric or token.isdigit())
+        ]
+
+    def get_entity_names(self, prefix: str) -> list[str]:
+        """Get the names of all entities below a prefix, including the prefix itself."""
+        node = self.get_node(prefix)
+        if node is None:
+            return []
+        entity_names = []
+        nodes = [(prefix, node)]
+        while nodes:
+            name, node = nodes.pop()
+            if node.is_entity:
+                entity_names.append(name)
+            nodes.extend((f"{name}.{token}", child) for token, child in node.children.items())
+        return sorted(entity_names)
+
+
+_ENTITY_TREES: weakref.WeakKeyDictionary[HomeAppliance, EntityTree] = weakref.WeakKeyDictionary()
+
+
+def get_entity_tree(appliance: HomeAppliance) -> EntityTree:
+    """Get the EntityTree of an appliance, the entities are only scanned once."""
+    tree = _ENTITY_TREES.get(appliance)
+    if tree is None:
+        tree = _ENTITY_TREES[appliance] = EntityTree(appliance.entities)
+    return tree
+
+
+class EnumOptions(NamedTuple):
+    """Options of an enum, shared between entities."""
+
+    options: tuple[str, ...]
+    # lowercase option to enum value
+    rev_options: Mapping[str, str]
+
+
+_ENUM_OPTIONS: dict[tuple[bool, tuple[tuple[Any, Any], ...]], EnumOptions] = {}
+
+
+def get_enum_options(enum: dict[Any, Any], *, lowercase: bool) -> EnumOptions:
+    """Get the options of an enum, interned per enum and case."""
+    key = (lowercase, tuple(enum.items()))
+    enum_options = _ENUM_OPTIONS.get(key)
+    if enum_options is None:
+        if lowercase:
+            options = tuple(sys.intern(str(value).lower()) for value in enum.values())
+            rev_options = {sys.intern(str(value).lower()): value for value in enum.values()}
         else:
-            program_name = program.lower().replace(".", "_")
-
-        programs[program] = program_name
-
-    # sort programs
-    programs_keys = list(programs.keys())
-    programs_keys.sort()
-    sorted_programs = {i: programs[i] for i in programs_keys}
-
-    return programs, sorted_programs
+            options = tuple(sys.intern(str(value)) for value in enum.values())
+            rev_options = {}
+        # shared between entities, so they can't be mutated
+        enum_options = _ENUM_OPTIONS[key] = EnumOptions(options, MappingProxyType(rev_options))
+    return enum_options
 
 
 async def get_config_entry_from_call(
@@ -125,12 +179,48 @@ async def get_config_entry_from_call(
     raise ServiceValidationError(msg)
 
 
-def entity_is_available(entity: HcEntity, available_access: tuple[Access]) -> bool:
-    """Check is HC entity is available."""
-    available = True
-    if hasattr(entity, "available"):
-        available &= entity.available
-
-    if hasattr(entity, "access"):
-        available &= entity.access in available_access
-    return available
+def get_snapshot(
+    appliance: HomeAppliance,
+    entity_names: Iterable[str] = (),
+    namespaces: Iterable[str] = (),
+) -> dict[str, dict[str, Any]]:
+    """
+    Get the values of the selected HC entities, or all entities if none are selected.
+
+    Only uid, value, access and available are included, identifying values are redacted.
+    """
+    selected = []
+    for entity_name in entity_names:
+        if entity_name not in appliance.entities:
+            msg = f"'{entity_name}' is not available on this Appliance"
+            raise ServiceValidationError(msg)
+        selected.append(entity_name)
+    for namespace in namespaces:
+        selected.extend(get_entity_tree(appliance).get_entity_names(namespace))
+    if not entity_names and not namespaces:
+        selected = appliance.entities
+
+    snapshot = {}
+    for entity_name in selected:
+        entity = appliance.entities[entity_name]
+        redact = entity_name.rsplit(".", 1)[-1] in SNAPSHOT_REDACT
+        state = {"uid": entity.uid, "value": REDACTED if redact else entity.value}
+        if hasattr(entity, "access"):
+            state["access"] = entity.access
+        if hasattr(entity, "available"):
+            state["available"] = entity.available
+        snapshot[entity_name] = state
+    return snapshot
+
+
+class AvailabilityCheck(NamedTuple):
+    """HC entity with the availability features it supports, detected once."""
+
+    entity: HcEntity
+    has_available: bool
+    has_access: bool
+
+
+def get_availability_check(entity: HcEntity) -> AvailabilityCheck:
+    """Detect the availability features of a HC entity."""
+    return AvailabilityCheck(entity, hasattr(entity, "available"), hasattr(entity, "access"))
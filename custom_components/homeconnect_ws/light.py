@@ -24,9 +24,11 @@ from homeconnect_websocket.message import Action
 from homeconnect_websocket.message import Message as HC_Message
 
 from .entity import HCEntity
-from .helpers import create_entities, entity_is_available
+from .helpers import create_entities
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.device_registry import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -66,15 +68,18 @@ class HCLight(HCEntity, LightEntity):
         device_info: DeviceInfo,
     ) -> None:
         super().__init__(entity_description, appliance, device_info)
+        self._derived_values: dict[str, Any] = {}
         if entity_description.brightness_entity is not None:
             self._brightness_entity = self._appliance.entities[entity_description.brightness_entity]
             self._entities.append(self._brightness_entity)
+            self._add_availability_check(self._brightness_entity)
 
         if entity_description.color_temperature_entity is not None:
             self._color_temperature_entity = self._appliance.entities[
                 entity_description.color_temperature_entity
             ]
             self._entities.append(self._color_temperature_entity)
+            self._add_availability_check(self._color_temperature_entity)
             self._color_temp_inverted = (
                 "Cooking.Hood.Setting.ColorTemperature" in self._appliance.entities
             )
@@ -82,6 +87,7 @@ class HCLight(HCEntity, LightEntity):
         if entity_description.color_entity is not None:
             self._color_entity = self._appliance.entities[entity_description.color_entity]
             self._entities.append(self._color_entity)
+            self._add_availability_check(self._color_entity)
 
         if entity_description.color_mode_entity is not None:
             self._color_mode_entity = self._appliance.entities[entity_description.color_mode_entity]
@@ -102,38 +108,31 @@ class HCLight(HCEntity, LightEntity):
             self._attr_supported_color_modes = {ColorMode.ONOFF}
             self._attr_color_mode = ColorMode.ONOFF
 
-    @property
-    def available(self) -> bool:
-        available = super().available
-        if self._brightness_entity:
-            available &= entity_is_available(
-                self._brightness_entity, self.entity_description.available_access
-            )
-        if self._color_temperature_entity:
-            available &= entity_is_available(
-                self._color_temperature_entity, self.entity_description.available_access
-            )
-        if self._color_entity:
-            available &= entity_is_available(
-                self._color_entity, self.entity_description.available_access
-            )
-        return available
-
     @property
     def is_on(self) -> bool | None:
         return bool(self._entity.value)
 
-    @property
-    def brightness(self) -> int | None:
+    async def callback(self, entity: HcEntity) -> None:
+        self._derived_values.clear()
+        await super().callback(entity)
+
+    def _get_derived_value(self, name: str, value_fn: Callable[[], Any]) -> Any:
+        """Get a value derived from the HC entities, computed once per update."""
+        if name not in self._derived_values:
+            self._derived_values[name] = value_fn()
+        return self._derived_values[name]
+
+    def _parse_color(self) -> tuple[int, ...]:
+        return tuple(rgb_hex_to_rgb_list(self._color_entity.value.strip("#")))
+
+    def _compute_brightness(self) -> int | None:
         if self._color_entity is not None:
-            rgb = rgb_hex_to_rgb_list(self._color_entity.value.strip("#"))
-            return max(rgb)
+            return max(self._get_derived_value("rgb", self._parse_color))
         if self._brightness_entity is not None:
             return value_to_brightness((1, 100), self._brightness_entity.value)
         return None
 
-    @property
-    def color_temp_kelvin(self) -> int | None:
+    def _compute_color_temp_kelvin(self) -> int | None:
         if self._color_temperature_entity is not None:
             if self._color_temp_inverted:
                 return scale_ranged_value_to_int_range(
@@ -149,13 +148,24 @@ class HCLight(HCEntity, LightEntity):
             )
         return None
 
-    @property
-    def rgb_color(self) -> tuple[int, int, int] | None:
+    def _compute_rgb_color(self) -> tuple[int, int, int] | None:
         if self._color_entity is not None:
-            rgb = rgb_hex_to_rgb_list(self._color_entity.value.strip("#"))
+            rgb = self._get_derived_value("rgb", self._parse_color)
             return match_max_scale((255,), rgb)
         return None
 
+    @property
+    def brightness(self) -> int | None:
+        return self._get_derived_value("brightness", self._compute_brightness)
+
+    @property
+    def color_temp_kelvin(self) -> int | None:
+        return self._get_derived_value("color_temp_kelvin", self._compute_color_temp_kelvin)
+
+    @property
+    def rgb_color(self) -> tuple[int, int, int] | None:
+        return self._get_derived_value("rgb_color", self._compute_rgb_color)
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         message = HC_Message(
             resource="/ro/values",
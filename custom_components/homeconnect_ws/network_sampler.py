@@ -0,0 +1,160 @@
+"""Adaptive sampling of the appliance network info."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from aiohttp.client_exceptions import ClientConnectionResetError
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+from homeconnect_websocket import HomeConnectError, NotConnectedError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+
+    from .connection_monitor import ConnectionMonitor
+
+_LOGGER = logging.getLogger(__name__)
+
+MIN_INTERVAL = 30
+MAX_INTERVAL = 600
+# RSSI changes up to this value (dBm) are considered stable
+STABLE_THRESHOLD = 2
+WINDOW_SIZE = 20
+
+
+class NetworkInfoSampler:
+    """
+    Sample the network info of an appliance.
+
+    The sample interval doubles while the RSSI is stable, up to MAX_INTERVAL, and no
+    samples are taken while the appliance is disconnected.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        appliance: HomeAppliance,
+        connection_monitor: ConnectionMonitor,
+    ) -> None:
+        self._hass = hass
+        self._appliance = appliance
+        self._connection_monitor = connection_monitor
+        self._listeners: list[Callable[[], None]] = []
+        self._request: asyncio.Future[list[dict[str, Any]] | None] | None = None
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._remove_connection_listener: CALLBACK_TYPE | None = None
+        self._samples: deque[int] = deque(maxlen=WINDOW_SIZE)
+        self.interval = MIN_INTERVAL
+        self.rssi: int | None = None
+
+    @property
+    def statistics(self) -> dict[str, float | None]:
+        """Min/avg/max RSSI over the sample window."""
+        if not self._samples:
+            return {"rssi_min": None, "rssi_avg": None, "rssi_max": None}
+        return {
+            "rssi_min": min(self._samples),
+            "rssi_avg": round(sum(self._samples) / len(self._samples), 1),
+            "rssi_max": max(self._samples),
+        }
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Add a listener called after every sample, sampling runs while there are listeners."""
+        self._listeners.append(listener)
+        if len(self._listeners) == 1:
+            self._async_start()
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            if not self._listeners:
+                self.async_stop()
+
+        return remove_listener
+
+    @callback
+    def _async_start(self) -> None:
+        self._remove_connection_listener = self._connection_monitor.async_add_listener(
+            self._async_connection_changed
+        )
+        if self._connection_monitor.connected:
+            self._async_schedule(0)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        if self._remove_connection_listener is not None:
+            self._remove_connection_listener()
+            self._remove_connection_listener = None
+
+    @callback
+    def _async_connection_changed(self, connected: bool) -> None:  # noqa: FBT001
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        if connected:
+            self.interval = MIN_INTERVAL
+            self._async_schedule(0)
+
+    @callback
+    def _async_schedule(self, delay: float) -> None:
+        self._cancel_timer = async_call_later(self._hass, delay, self._async_timer_fired)
+
+    async def _async_timer_fired(self, _: datetime) -> None:
+        self._cancel_timer = None
+        try:
+            network_info = await self.async_get_network_info()
+            if network_info and isinstance(network_info, list) and "rssi" in network_info[0]:
+                self._add_sample(network_info[0]["rssi"])
+                for listener in list(self._listeners):
+                    listener()
+        finally:
+            if self._listeners and self._connection_monitor.connected:
+                self._async_schedule(self.interval)
+
+    def _add_sample(self, rssi: int) -> None:
+        if self.rssi is not None and abs(rssi - self.rssi) <= STABLE_THRESHOLD:
+            self.interval = min(self.interval * 2, MAX_INTERVAL)
+        else:
+            self.interval = MIN_INTERVAL
+        self.rssi = rssi
+        self._samples.append(rssi)
+
+    async def async_get_network_info(self) -> list[dict[str, Any]] | None:
+        """Get the network info, concurrent calls share one request."""
+        if self._request is None:
+            self._request = self._hass.async_create_task(self._async_request())
+        request = self._request
+        try:
+            return await asyncio.shield(request)
+        finally:
+            if request.done() and self._request is request:
+                self._request = None
+
+    async def _async_request(self) -> list[dict[str, Any]] | None:
+        try:
+            network_info = await self._appliance.get_network_config()
+        except ClientConnectionResetError:
+            _LOGGER.debug("Network info update failed: Connection reset")
+        except NotConnectedError:
+            _LOGGER.debug("Network info update failed: Not connected")
+        except (TimeoutError, HomeConnectError) as exc:
+            _LOGGER.debug("Network info update failed: %s", repr(exc))
+        else:
+            if not (network_info and isinstance(network_info, list)):
+                _LOGGER.debug("Network info update failed: unexpected response: %s", network_info)
+            return network_info
+        return None
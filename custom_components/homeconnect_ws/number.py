@@ -72,4 +72,4 @@ class HCNumber(HCEntity, NumberEntity):
         return None
 
     async def async_set_native_value(self, value: float) -> None:
-        await self._entity.set_value(int(value))
+        await self._async_set_value(int(value))
@@ -0,0 +1,150 @@
+"""Program names of an appliance."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from homeconnect_websocket import HomeAppliance
+    from homeconnect_websocket.entities import Entity as HcEntity
+    from homeconnect_websocket.entities import Execution
+
+    from .entity_descriptions import _EntityDescriptionsType
+
+FAVORITE_PATTERN = re.compile(r"^BSH\.Common\.Program\.Favorite\.(.*)$")
+
+
+def get_program_name(program: str, favorite_name_entity: HcEntity | None = None) -> str:
+    """Get the option name of a program."""
+    if match := FAVORITE_PATTERN.match(program):
+        if favorite_name_entity and favorite_name_entity.value:
+            return favorite_name_entity.value
+        return f"favorite_{match.groups()[0]}"
+    return program.lower().replace(".", "_")
+
+
+def get_program_catalogue(programs: Mapping[str, str]) -> ProgramCatalogue:
+    """Get the catalogue of a program description mapping."""
+    if isinstance(programs, ProgramCatalogue):
+        return programs
+    return ProgramCatalogue(programs)
+
+
+def get_program_catalogue_from_descriptions(
+    available_entities: _EntityDescriptionsType,
+) -> ProgramCatalogue | None:
+    """Get the catalogue of the program select description, if there is one."""
+    for description in available_entities.get("program", []):
+        if isinstance(description.mapping, ProgramCatalogue):
+            return description.mapping
+    return None
+
+
+class ProgramCatalogue(Mapping[str, str]):
+    """
+    Program option names by program, sorted by program.
+
+    The reverse map, option list and execution buckets are computed once. Favorite
+    programs are renamed in place when their name setting changes.
+    """
+
+    def __init__(
+        self,
+        programs: Mapping[str, str],
+        executions: Mapping[Execution, tuple[str, ...]] | None = None,
+    ) -> None:
+        self._programs = {program: programs[program] for program in sorted(programs)}
+        self._positions = {program: position for position, program in enumerate(self._programs)}
+        self.rev_programs = {name: program for program, name in self._programs.items()}
+        self.options = list(self._programs.values())
+        self.executions = dict(executions or {})
+        self._favorite_names: dict[HcEntity, str] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self._started = False
+
+    @classmethod
+    def from_appliance(cls, appliance: HomeAppliance) -> ProgramCatalogue:
+        """Create the catalogue of an appliance."""
+        programs = {}
+        favorite_names = {}
+        executions: dict[Execution, list[str]] = {}
+        for program_name, program in appliance.programs.items():
+            favorite_name_entity = None
+            if match := FAVORITE_PATTERN.match(program_name):
+                favorite_name_entity = appliance.settings.get(
+                    f"BSH.Common.Setting.Favorite.{match.groups()[0]}.Name"
+                )
+                if favorite_name_entity is not None:
+                    favorite_names[favorite_name_entity] = program_name
+            programs[program_name] = get_program_name(program_name, favorite_name_entity)
+            executions.setdefault(program.execution, []).append(program_name)
+
+        catalogue = cls(
+            programs,
+            {execution: tuple(sorted(names)) for execution, names in executions.items()},
+        )
+        catalogue._favorite_names = favorite_names
+        return catalogue
+
+    def __getitem__(self, program: str) -> str:
+        return self._programs[program]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._programs)
+
+    def __len__(self) -> int:
+        return len(self._programs)
+
+    @callback
+    def async_start(self) -> None:
+        """Follow the favorite name settings."""
+        if self._started:
+            return
+        self._started = True
+        for favorite_name_entity in self._favorite_names:
+            favorite_name_entity.register_callback(self._async_favorite_renamed)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the favorite name settings."""
+        if self._started:
+            self._started = False
+            for favorite_name_entity in self._favorite_names:
+                favorite_name_entity.unregister_callback(self._async_favorite_renamed)
+        self._listeners.clear()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Add a listener called when a program is renamed."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    async def _async_favorite_renamed(self, favorite_name_entity: HcEntity) -> None:
+        program = self._favorite_names[favorite_name_entity]
+        old_name = self._programs[program]
+        new_name = get_program_name(program, favorite_name_entity)
+        if new_name == old_name:
+            return
+        # the program order doesn't change, only its option. The list is replaced, not
+        # changed in place, it's also the options attribute of the written states.
+        options = list(self.options)
+        options[self._positions[program]] = new_name
+        self.options = options
+        self._programs[program] = new_name
+        if self.rev_programs.get(old_name) == program:
+            del self.rev_programs[old_name]
+        self.rev_programs[new_name] = program
+        for listener in list(self._listeners):
+            listener()
@@ -8,9 +8,12 @@ from homeassistant.components.select import SelectEntity
 from homeconnect_websocket.entities import Execution
 
 from .entity import HCEntity
-from .helpers import create_entities
+from .helpers import create_entities, get_enum_options
+from .program_catalogue import get_program_catalogue
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.device_registry import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -19,6 +22,7 @@ if TYPE_CHECKING:
 
     from . import HCConfigEntry
     from .entity_descriptions.descriptions_definitions import HCSelectEntityDescription
+    from .program_catalogue import ProgramCatalogue
 PARALLEL_UPDATES = 0
 
 
@@ -39,7 +43,7 @@ class HCSelect(HCEntity, SelectEntity):
     """Select Entity."""
 
     entity_description: HCSelectEntityDescription
-    _rev_options: dict[str, str]
+    _rev_options: Mapping[str, str]
 
     def __init__(
         self,
@@ -50,20 +54,20 @@ class HCSelect(HCEntity, SelectEntity):
         super().__init__(entity_description, appliance, device_info)
 
         self._rev_options = {}
+        if self._entity.enum:
+            enum_options = get_enum_options(
+                self._entity.enum, lowercase=entity_description.has_state_translation
+            )
+            self._rev_options = enum_options.rev_options
         if entity_description.options:
             self._attr_options = entity_description.options
         elif self._entity.enum:
-            self._attr_options = []
-            if self.entity_description.has_state_translation:
-                for value in self._entity.enum.values():
-                    self._attr_options.append(str(value).lower())
-            else:
-                for value in self._entity.enum.values():
-                    self._attr_options.append(str(value))
-
-        if self.entity_description.has_state_translation and self._entity.enum:
-            for value in self._entity.enum.values():
-                self._rev_options[str(value).lower()] = value
+            self._attr_options = enum_options.options
+
+    @property
+    def options(self) -> list[str]:
+        # Enum options are a tuple shared between entities, the state attribute is a list
+        return list(super().options)
 
     @property
     def current_option(self) -> str:
@@ -79,13 +83,14 @@ class HCSelect(HCEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         if self._rev_options:
             option = self._rev_options[option]
-        await self._entity.set_value(option)
+        await self._async_set_value(option)
 
 
 class HCProgram(HCSelect):
     """Program select Entity."""
 
     _entity: SelectedProgram
+    _catalogue: ProgramCatalogue
 
     def __init__(
         self,
@@ -94,23 +99,29 @@ class HCProgram(HCSelect):
         device_info: DeviceInfo,
     ) -> None:
         super().__init__(entity_description, appliance, device_info)
-        self._programs = entity_description.mapping
-        self._rev_programs = {value: key for key, value in self._programs.items()}
+        self._catalogue = get_program_catalogue(entity_description.mapping)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._catalogue.async_add_listener(self._async_programs_renamed))
+
+    def _async_programs_renamed(self) -> None:
+        self.async_schedule_write_ha_state()
 
     @property
     def options(self) -> list[str] | None:
-        return list(self._programs.values())
+        return self._catalogue.options
 
     @property
     def current_option(self) -> list[str] | None:
         if self._appliance.selected_program:
-            if self._appliance.selected_program.name in self._programs:
-                return self._programs[self._appliance.selected_program.name]
+            if self._appliance.selected_program.name in self._catalogue:
+                return self._catalogue[self._appliance.selected_program.name]
             return self._appliance.selected_program.name
         return None
 
     async def async_select_option(self, option: str) -> None:
-        selected_program = self._appliance.programs[self._rev_programs[option]]
+        selected_program = self._appliance.programs[self._catalogue.rev_programs[option]]
         if selected_program.execution in (Execution.SELECT_ONLY, Execution.SELECT_AND_START):
             await selected_program.select()
         elif selected_program.execution == Execution.START_ONLY:
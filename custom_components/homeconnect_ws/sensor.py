@@ -5,13 +5,13 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from aiohttp.client_exceptions import ClientConnectionResetError
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeconnect_websocket import HomeAppliance, NotConnectedError
+from homeconnect_websocket import HomeAppliance
 
 from .entity import HCEntity
-from .helpers import create_entities
+from .helpers import create_entities, get_enum_options
+from .program_catalogue import get_program_catalogue
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 
     from . import HCConfigEntry
     from .entity_descriptions.descriptions_definitions import HCSensorEntityDescription
+    from .network_sampler import NetworkInfoSampler
+    from .program_catalogue import ProgramCatalogue
 
 PARALLEL_UPDATES = 0
 
@@ -59,10 +61,16 @@ class HCSensor(HCEntity, SensorEntity):
         super().__init__(entity_description, appliance, device_info)
 
         if self._entity.enum:
-            if self.entity_description.has_state_translation:
-                self._attr_options = [str(value).lower() for value in self._entity.enum.values()]
-            else:
-                self._attr_options = [str(value) for value in self._entity.enum.values()]
+            self._attr_options = get_enum_options(
+                self._entity.enum, lowercase=entity_description.has_state_translation
+            ).options
+
+    @property
+    def options(self) -> list[str] | None:
+        # Enum options are a tuple shared between entities, the state attribute is a list
+        if (options := super().options) is not None:
+            return list(options)
+        return None
 
     @property
     def native_value(self) -> int | float | str:
@@ -88,6 +96,15 @@ class HCEventSensor(HCEntity, SensorEntity):
                     return value
         return self.entity_description.options[-1]
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._connection_monitor.async_add_listener(self._async_connection_changed)
+        )
+
+    def _async_connection_changed(self, _: bool) -> None:  # noqa: FBT001
+        self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         return self._appliance.session.connected
@@ -97,6 +114,7 @@ class HCActiveProgram(HCSensor):
     """Active Program Sensor Entity."""
 
     entity_description: HCSensorEntityDescription
+    _catalogue: ProgramCatalogue
 
     def __init__(
         self,
@@ -105,38 +123,49 @@ class HCActiveProgram(HCSensor):
         device_info: DeviceInfo,
     ) -> None:
         super().__init__(entity_description, appliance, device_info)
-        self._attr_options = list(entity_description.mapping.values())
+        self._catalogue = get_program_catalogue(entity_description.mapping)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._catalogue.async_add_listener(self._async_programs_renamed))
+
+    def _async_programs_renamed(self) -> None:
+        self.async_schedule_write_ha_state()
+
+    @property
+    def options(self) -> list[str] | None:
+        return self._catalogue.options
 
     @property
     def native_value(self) -> str | None:
         if self._appliance.active_program:
-            if self._appliance.active_program.name in self.entity_description.mapping:
-                return self.entity_description.mapping[self._appliance.active_program.name]
+            if self._appliance.active_program.name in self._catalogue:
+                return self._catalogue[self._appliance.active_program.name]
             return self._appliance.active_program.name
         return None
 
 
 class HCWiFI(HCEntity, SensorEntity):
-    """WiFi signal Sensor Entity with push-like updates."""
+    """WiFi signal Sensor Entity updated by the network info sampler."""
 
-    _attr_should_poll = True
+    _network_sampler: NetworkInfoSampler | None = None
 
-    def __init__(
-        self,
-        entity_description: HCSensorEntityDescription,
-        appliance: HomeAppliance,
-        device_info: DeviceInfo,
-    ) -> None:
-        super().__init__(entity_description, appliance, device_info)
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._network_sampler = self.platform.config_entry.runtime_data.network_sampler
+        self.async_on_remove(self._network_sampler.async_add_listener(self._async_sampled))
 
-    async def async_update(self) -> None:
-        try:
-            network_info = await self._appliance.get_network_config()
-            if network_info and isinstance(network_info, list) and "rssi" in network_info[0]:
-                self._attr_native_value = network_info[0]["rssi"]
-            else:
-                _LOGGER.debug("WiFi update failed: unexpected response format: %s", network_info)
-        except ClientConnectionResetError:
-            _LOGGER.debug("WiFi update failed: Connection reset")
-        except NotConnectedError:
-            _LOGGER.debug("WiFi update failed: Not connected")
+    def _async_sampled(self) -> None:
+        self.async_schedule_write_ha_state()
+
+    @property
+    def native_value(self) -> int | None:
+        if self._network_sampler is None:
+            return None
+        return self._network_sampler.rssi
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        if self._network_sampler is None:
+            return {}
+        return self._network_sampler.statistics
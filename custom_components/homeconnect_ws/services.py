@@ -0,0 +1,110 @@
+"""Services of the Home Connect Websocket integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeconnect_websocket.errors import AccessError
+
+from .const import DOMAIN
+from .helpers import get_config_entry_from_call, get_snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+
+def _get_relative_seconds(relative_time: Mapping[str, Any]) -> int:
+    return (
+        int(relative_time.get("hours", 0)) * 3600
+        + int(relative_time.get("minutes", 0)) * 60
+        + int(relative_time.get("seconds", 0))
+    )
+
+
+async def _async_start_program(call: ServiceCall) -> ServiceResponse:
+    config_entry = await get_config_entry_from_call(call.hass, call)
+
+    options = {}
+    appliance = config_entry.runtime_data.appliance
+    if "start_in" in call.data:
+        if start_in_entity := appliance.entities.get("BSH.Common.Option.StartInRelative"):
+            options[start_in_entity.uid] = _get_relative_seconds(call.data["start_in"])
+        else:
+            msg = "'Start in' is not available on this Appliance"
+            raise ServiceValidationError(msg)
+    if "finish_in" in call.data:
+        if finish_in_entity := appliance.entities.get("BSH.Common.Option.FinishInRelative"):
+            options[finish_in_entity.uid] = _get_relative_seconds(call.data["finish_in"])
+        else:
+            msg = "'Finish in' is not available on this Appliance"
+            raise ServiceValidationError(msg)
+    if appliance.selected_program:
+        await appliance.selected_program.start(options)
+    else:
+        msg = "No Program selected"
+        raise ServiceValidationError(msg)
+
+
+async def _async_set_start_in(call: ServiceCall) -> ServiceResponse:
+    config_entry = await get_config_entry_from_call(call.hass, call)
+    appliance = config_entry.runtime_data.appliance
+    if start_in_entity := appliance.entities.get("BSH.Common.Option.StartInRelative"):
+        await config_entry.runtime_data.write_batcher.async_set_value(
+            start_in_entity, _get_relative_seconds(call.data["start_in"])
+        )
+    else:
+        msg = "'Start in' is not available on this Appliance"
+        raise ServiceValidationError(msg)
+
+
+async def _async_set_finish_in(call: ServiceCall) -> ServiceResponse:
+    config_entry = await get_config_entry_from_call(call.hass, call)
+    appliance = config_entry.runtime_data.appliance
+    if finish_in_entity := appliance.entities.get("BSH.Common.Option.FinishInRelative"):
+        await config_entry.runtime_data.write_batcher.async_set_value(
+            finish_in_entity, _get_relative_seconds(call.data["finish_in"])
+        )
+    else:
+        msg = "'Finish in' is not available on this Appliance"
+        raise ServiceValidationError(msg)
+
+
+async def _async_set_values(call: ServiceCall) -> ServiceResponse:
+    config_entry = await get_config_entry_from_call(call.hass, call)
+    appliance = config_entry.runtime_data.appliance
+    values = {}
+    for entity_name, value in call.data["values"].items():
+        if entity := appliance.entities.get(entity_name):
+            values[entity] = value
+        else:
+            msg = f"'{entity_name}' is not available on this Appliance"
+            raise ServiceValidationError(msg)
+    try:
+        await config_entry.runtime_data.write_batcher.async_set_values(values)
+    except (ValueError, AccessError) as exc:
+        raise ServiceValidationError(str(exc)) from exc
+
+
+async def _async_get_snapshot(call: ServiceCall) -> ServiceResponse:
+    config_entry = await get_config_entry_from_call(call.hass, call)
+    appliance = config_entry.runtime_data.appliance
+    return {
+        "entities": get_snapshot(
+            appliance, call.data.get("entities", ()), call.data.get("namespaces", ())
+        )
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(DOMAIN, "start_program", _async_start_program)
+    hass.services.async_register(DOMAIN, "set_start_in", _async_set_start_in)
+    hass.services.async_register(DOMAIN, "set_finish_in", _async_set_finish_in)
+    hass.services.async_register(DOMAIN, "set_values", _async_set_values)
+    hass.services.async_register(
+        DOMAIN, "get_snapshot", _async_get_snapshot, supports_response=SupportsResponse.ONLY
+    )
@@ -57,12 +57,12 @@ class HCSwitch(HCEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         if self._value_mapping:
-            await self._entity.set_value(self._value_mapping[0])
+            await self._async_set_value(self._value_mapping[0])
         else:
-            await self._entity.set_value(True)
+            await self._async_set_value(value=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         if self._value_mapping:
-            await self._entity.set_value(self._value_mapping[1])
+            await self._async_set_value(self._value_mapping[1])
         else:
-            await self._entity.set_value(False)
+            await self._async_set_value(value=False)
@@ -0,0 +1,150 @@
+"""Batched value writes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeconnect_websocket.message import Action, Message
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+    from homeconnect_websocket.entities import Entity as HcEntity
+
+# Time in seconds writes are collected before they are sent
+WRITE_WINDOW = 0.02
+
+
+def get_raw_value(entity: HcEntity, value: Any) -> Any:
+    """Get the raw value of an enum value, values of other entities are unchanged."""
+    if entity.enum:
+        for raw_value, enum_value in entity.enum.items():
+            if enum_value == value:
+                return raw_value
+    return value
+
+
+class ValueWriteBatcher:
+    """
+    Merge value writes of an appliance.
+
+    Writes issued within WRITE_WINDOW are sent as one /ro/values POST. A later write
+    to the same uid replaces the earlier one. A single write and the writes of a
+    rejected merged message are sent through Entity.set_value, so the library
+    validates them and a rejected value only fails its own caller.
+    """
+
+    def __init__(self, hass: HomeAssistant, appliance: HomeAppliance) -> None:
+        self._hass = hass
+        self._appliance = appliance
+        self._waiters: list[tuple[asyncio.Future[None], dict[HcEntity, Any]]] = []
+        self._send_handle: asyncio.TimerHandle | None = None
+        self._send_tasks: set[asyncio.Task] = set()
+        self.queued_writes = 0
+        self.sent_messages = 0
+
+    async def async_set_value(self, entity: HcEntity, value: Any) -> None:
+        """Set the value of an entity."""
+        await self.async_set_values({entity: value})
+
+    async def async_set_values(self, values: dict[HcEntity, Any]) -> None:
+        """Queue the values of multiple entities and wait until they are sent."""
+        for entity, value in values.items():
+            if entity.enum and value not in entity.enum.values():
+                # Let the library reject the value
+                await entity.set_value(value)
+        self.queued_writes += len(values)
+        waiter = self._hass.loop.create_future()
+        self._waiters.append((waiter, dict(values)))
+        if self._send_handle is None:
+            self._send_handle = self._hass.loop.call_later(WRITE_WINDOW, self._async_send)
+        await waiter
+
+    @callback
+    def _async_send(self) -> None:
+        self._send_handle = None
+        waiters, self._waiters = self._waiters, []
+        task = self._hass.async_create_task(self._async_send_writes(waiters), eager_start=True)
+        if not task.done():
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+
+    async def _async_send_writes(
+        self, waiters: list[tuple[asyncio.Future[None], dict[HcEntity, Any]]]
+    ) -> None:
+        try:
+            if len(waiters) == 1 and len(waiters[0][1]) == 1:
+                await self._async_send_each(*waiters[0])
+                return
+            values = {}
+            for _, caller_values in waiters:
+                values.update(caller_values)
+            try:
+                await self._async_post(values)
+            except Exception:  # noqa: BLE001
+                # Resend the values of each caller, so a rejected value only fails its caller
+                for waiter, caller_values in waiters:
+                    await self._async_send_each(waiter, caller_values)
+            else:
+                for waiter, _ in waiters:
+                    self._set_waiter_result(waiter)
+        except asyncio.CancelledError:
+            for waiter, _ in waiters:
+                waiter.cancel()
+            raise
+
+    async def _async_send_each(
+        self, waiter: asyncio.Future[None], values: dict[HcEntity, Any]
+    ) -> None:
+        try:
+            for entity, value in values.items():
+                self.sent_messages += 1
+                await entity.set_value(value)
+        except Exception as exc:  # noqa: BLE001
+            self._set_waiter_result(waiter, exc)
+        else:
+            self._set_waiter_result(waiter)
+
+    async def _async_post(self, values: dict[HcEntity, Any]) -> None:
+        data = [
+            {"uid": entity.uid, "value": get_raw_value(entity, value)}
+            for entity, value in values.items()
+        ]
+        message = Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=data[0] if len(data) == 1 else data,
+        )
+        self.sent_messages += 1
+        await self._appliance.session.send_sync(message)
+
+    @staticmethod
+    def _set_waiter_result(waiter: asyncio.Future[None], exc: Exception | None = None) -> None:
+        if waiter.done():
+            return
+        if exc is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(exc)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel pending writes."""
+        if self._send_handle is not None:
+            self._send_handle.cancel()
+            self._send_handle = None
+        for task in self._send_tasks:
+            task.cancel()
+        self._send_tasks.clear()
+        for waiter, _ in self._waiters:
+            waiter.cancel()
+        self._waiters.clear()
+
+    def as_dict(self) -> dict[str, int]:
+        """Get write counters."""
+        return {
+            "queued_writes": self.queued_writes,
+            "sent_messages": self.sent_messages,
+        }
@@ -0,0 +1,107 @@
+"""Coalesced state writes."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+
+    from .entity import HCEntity
+
+# Time to wait for a reconnect before writing the pending states
+RECONNECT_TIMEOUT = 10
+
+
+class StateWriteScheduler:
+    """
+    Coalesce state writes of an appliance.
+
+    Entities updated while one message is dispatched are marked dirty and written once
+    on the next event loop iteration. While the appliance is disconnected dirty entities
+    are kept until the session reconnects.
+    """
+
+    def __init__(self, hass: HomeAssistant, appliance: HomeAppliance) -> None:
+        self._hass = hass
+        self._appliance = appliance
+        self._dirty: dict[HCEntity, None] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self.scheduled_writes = 0
+        self.coalesced_writes = 0
+        self.flushed_writes = 0
+
+    @callback
+    def async_schedule_write(self, entity: HCEntity) -> None:
+        """Mark entity as dirty and schedule a flush."""
+        self.scheduled_writes += 1
+        if entity in self._dirty:
+            self.coalesced_writes += 1
+            return
+        self._dirty[entity] = None
+        if self._flush_task is not None or self._reconnect_task is not None:
+            return
+        if self._appliance.session.connected:
+            # Not started eagerly, so writes of the current iteration are coalesced
+            self._flush_task = self._hass.async_create_task(
+                self._async_flush_soon(), "homeconnect_ws flush states", eager_start=False
+            )
+        else:
+            self._reconnect_task = self._hass.async_create_background_task(
+                self._async_flush_on_reconnect(), "homeconnect_ws flush on reconnect"
+            )
+
+    @callback
+    def async_discard(self, entity: HCEntity) -> None:
+        """Remove entity from the pending writes."""
+        self._dirty.pop(entity, None)
+
+    async def _async_flush_on_reconnect(self) -> None:
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(
+                self._appliance.session.connected_event.wait(), RECONNECT_TIMEOUT
+            )
+        self._reconnect_task = None
+        self._async_flush()
+
+    async def _async_flush_soon(self) -> None:
+        self._async_flush()
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of entities waiting to be written."""
+        return len(self._dirty)
+
+    @callback
+    def _async_flush(self) -> None:
+        self._flush_task = None
+        dirty, self._dirty = self._dirty, {}
+        for entity in dirty:
+            entity.async_write_ha_state()
+        self.flushed_writes += len(dirty)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel pending writes."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        self._dirty.clear()
+
+    def as_dict(self) -> dict[str, int]:
+        """Get write counters."""
+        return {
+            "scheduled_writes": self.scheduled_writes,
+            "coalesced_writes": self.coalesced_writes,
+            "flushed_writes": self.flushed_writes,
+            "pending_writes": self.pending_writes,
+        }
@@ -0,0 +1,71 @@
+"""Benchmark the RSS of identical appliances with copied and interned descriptions."""
+
+from __future__ import annotations
+
+import gc
+import json
+import resource
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.homeconnect_ws.description_store import (
+    intern_description,
+)
+from homeconnect_websocket.testutils import MockAppliance
+from tests.const import DEVICE_DESCRIPTION
+
+APPLIANCES = 50
+MODES = ("copied", "interned")
+
+
+def get_rss() -> int:
+    """Get the resident set size in bytes."""
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * resource.getpagesize()
+    # peak RSS, in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(mode: str, count: int) -> int:
+    """Get the RSS increase of count appliances."""
+    # every config entry has its own copy of the stored description
+    stored = json.dumps(DEVICE_DESCRIPTION)
+    gc.collect()
+    rss = get_rss()
+    appliances = []
+    for number in range(count):
+        description = json.loads(stored)
+        description["info"]["deviceID"] = f"device_{number}"
+        if mode == "interned":
+            description = intern_description(description)
+        appliances.append(MockAppliance(description, "host", "app", "app_id", "psk"))
+    gc.collect()
+    return get_rss() - rss
+
+
+def main() -> None:
+    """Run benchmark, each mode is measured in a new process."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else APPLIANCES
+    if len(sys.argv) > 2:
+        print(measure(sys.argv[2], count))  # noqa: T201
+        return
+    for mode in MODES:
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, __file__, str(count), mode],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        size = int(result.stdout)
+        print(  # noqa: T201
+            f"{count} appliances, {mode} descriptions: "
+            f"{size / 1024:.1f} KiB RSS, {size / count / 1024:.1f} KiB per appliance"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark resolving available Entity descriptions."""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.homeconnect_ws import entity_descriptions
+from homeconnect_websocket.testutils import MockAppliance
+from tests.const import DEVICE_DESCRIPTION
+
+if TYPE_CHECKING:
+    from homeconnect_websocket import HomeAppliance
+
+ROUNDS = 1000
+
+
+_CATALOGUE = entity_descriptions.get_all_entity_description()
+
+
+def linear_static_descriptions(appliance: HomeAppliance) -> list:
+    """Resolve static descriptions by checking every description in the catalogue."""
+    available = []
+    appliance_entities = set(appliance.entities)
+    for description_type, descriptions in _CATALOGUE.items():
+        for description in descriptions:
+            if callable(description):
+                continue
+            all_subscribed_entities = set()
+            if description.entity:
+                all_subscribed_entities.add(description.entity)
+            if description.entities:
+                all_subscribed_entities.update(description.entities)
+            if appliance_entities.issuperset(all_subscribed_entities):
+                available.append((description_type, description))
+    return available
+
+
+def indexed_static_descriptions(appliance: HomeAppliance) -> list:
+    """Resolve static descriptions with the description index."""
+    return [
+        (indexed.description_type, indexed.description)
+        for family in entity_descriptions.get_families(appliance.entities)
+        for indexed in entity_descriptions.get_family_index(family).lookup(appliance.entities)
+    ]
+
+
+def main() -> None:
+    """Run benchmark."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "app", "app_id", "psk")
+    linear = linear_static_descriptions(appliance)
+    indexed = indexed_static_descriptions(appliance)
+    assert sorted(id(description) for _, description in linear) == sorted(  # noqa: S101
+        id(description) for _, description in indexed
+    )
+
+    catalogue_size = sum(len(descriptions) for descriptions in _CATALOGUE.values())
+    print(  # noqa: T201
+        f"catalogue: {catalogue_size} descriptions, appliance: {len(appliance.entities)} entities"
+    )
+    for name, func in (
+        ("linear", linear_static_descriptions),
+        ("indexed", indexed_static_descriptions),
+    ):
+        seconds = min(timeit.repeat(lambda f=func: f(appliance), number=ROUNDS, repeat=5))
+        print(f"{name:>8}: {seconds / ROUNDS * 1e6:8.2f} us per appliance")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the import cost of the integration and its Entity descriptions."""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+ROUNDS = 5
+
+# Imported before measuring, the integration's own import cost is measured
+PRELOAD = """
+import aiohttp
+import homeassistant.config_entries
+import homeassistant.helpers.device_registry
+import homeassistant.helpers.entity
+import homeassistant.helpers.service
+import homeassistant.helpers.storage
+import homeassistant.loader
+import homeconnect_websocket
+import voluptuous
+"""
+
+MEASURE = """
+import sys
+import time
+start = time.perf_counter()
+import custom_components.homeconnect_ws
+from custom_components.homeconnect_ws import entity_descriptions
+imported = time.perf_counter()
+{load}
+loaded = time.perf_counter()
+families = sorted(
+    family.name
+    for family in entity_descriptions.DESCRIPTION_FAMILIES
+    if f"{{entity_descriptions.__name__}}.{{family.name}}" in sys.modules
+)
+print(imported - start, loaded - imported, ",".join(families) or "-")
+"""
+
+CASES = {
+    "import only": "",
+    "dishwasher": (
+        "for family in entity_descriptions.get_families("
+        "['BSH.Common.Status.DoorState', 'Dishcare.Dishwasher.Status.SaltNearlyEmpty']):\n"
+        "    entity_descriptions.get_family_index(family)"
+    ),
+    "all families": "entity_descriptions.get_all_entity_description()",
+}
+
+
+def run(load: str) -> tuple[float, float, str]:
+    """Run one measurement in a new interpreter."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", PRELOAD + MEASURE.format(load=load)],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imported, loaded, families = result.stdout.split()
+    return float(imported), float(loaded), families
+
+
+def main() -> None:
+    """Run benchmark."""
+    for name, load in CASES.items():
+        results = [run(load) for _ in range(ROUNDS)]
+        imported = statistics.median(result[0] for result in results)
+        loaded = statistics.median(result[1] for result in results)
+        print(  # noqa: T201
+            f"{name:>12}: import {imported * 1e3:7.2f} ms, "
+            f"descriptions {loaded * 1e3:7.2f} ms, families: {results[0][2]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the memory used by the Entities of a synthetic install."""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_components.homeconnect_ws import HCData
+from custom_components.homeconnect_ws.binary_sensor import HCBinarySensor
+from custom_components.homeconnect_ws.button import HCButton, HCStartButton
+from custom_components.homeconnect_ws.fan import HCFan
+from custom_components.homeconnect_ws.helpers import create_entities
+from custom_components.homeconnect_ws.light import HCLight
+from custom_components.homeconnect_ws.number import HCNumber
+from custom_components.homeconnect_ws.select import HCProgram, HCSelect
+from custom_components.homeconnect_ws.sensor import (
+    HCActiveProgram,
+    HCEventSensor,
+    HCSensor,
+)
+from custom_components.homeconnect_ws.switch import HCSwitch
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeconnect_websocket.testutils import MockAppliance
+from tests.const import DEVICE_DESCRIPTION, ENTITY_DESCRIPTIONS
+
+APPLIANCES = 50
+
+ENTITY_CLASSES = {
+    "active_program": HCActiveProgram,
+    "binary_sensor": HCBinarySensor,
+    "button": HCButton,
+    "event_sensor": HCEventSensor,
+    "fan": HCFan,
+    "light": HCLight,
+    "number": HCNumber,
+    "program": HCProgram,
+    "select": HCSelect,
+    "sensor": HCSensor,
+    "start_button": HCStartButton,
+    "switch": HCSwitch,
+}
+
+
+def main() -> None:
+    """Run benchmark."""
+    appliances = []
+    for number in range(APPLIANCES):
+        appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "app", "app_id", "psk")
+        appliance.info = {**appliance.info, "deviceID": f"device_{number}"}
+        appliances.append(appliance)
+
+    gc.collect()
+    tracemalloc.start()
+    entities = [
+        create_entities(
+            ENTITY_CLASSES,
+            HCData(appliance, DeviceInfo(name=appliance.info["deviceID"]), ENTITY_DESCRIPTIONS),
+        )
+        for appliance in appliances
+    ]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    entity_count = sum(len(appliance_entities) for appliance_entities in entities)
+    print(  # noqa: T201
+        f"{APPLIANCES} appliances, {entity_count} entities: "
+        f"{size / 1024:.1f} KiB, {size / entity_count:.0f} bytes per entity"
+    )
+
+
+if __name__ == "__main__":
+    main()
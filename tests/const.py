@@ -41,7 +41,7 @@ MOCK_APPLIANCE_INFO = {
 
 MOCK_TLS_DEVICE_ID = "010203040506070809"
 MOCK_TLS_DEVICE_ID_2 = "102030405060708090"
-MOCK_TLS_DEVICE_DESCRIPTION = "MOCK_TLS_DEVICE_DESCRIPTION"
+MOCK_TLS_DEVICE_DESCRIPTION = {"info": {"vib": "Test_vib"}, "status": ["MOCK_TLS_STATUS"]}
 MOCK_TLS_DEVICE_INFO = {
     "haId": MOCK_TLS_DEVICE_ID,
     "type": "Test_TLS",
@@ -58,7 +58,7 @@ MOCK_TLS_DEVICE_INFO = {
 
 
 MOCK_AES_DEVICE_ID = "101112131415161718"
-MOCK_AES_DEVICE_DESCRIPTION = "MOCK_AES_DEVICE_DESCRIPTION"
+MOCK_AES_DEVICE_DESCRIPTION = {"info": {"vib": "Test_vib"}, "status": ["MOCK_AES_STATUS"]}
 MOCK_AES_DEVICE_INFO = {
     "haId": MOCK_AES_DEVICE_ID,
     "type": "Test_AES",
@@ -4,20 +4,22 @@ from __future__ import annotations
 
 from binascii import Error as BinasciiError
 from typing import TYPE_CHECKING
-from unittest.mock import ANY, AsyncMock, MagicMock, Mock, call
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
 from custom_components.homeconnect_ws import config_flow
 from custom_components.homeconnect_ws.const import (
     CONF_AES_IV,
+    CONF_DESCRIPTION_HASH,
     CONF_FILE,
     CONF_MANUAL_HOST,
     CONF_PSK,
     DOMAIN,
 )
+from custom_components.homeconnect_ws.description_store import get_description_hash
 from homeassistant.config_entries import SOURCE_IGNORE, SOURCE_USER
-from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE, CONF_HOST, CONF_NAME
+from homeassistant.const import CONF_DEVICE, CONF_HOST, CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.selector import SelectOptionDict
 from homeconnect_websocket import ParserError
@@ -131,7 +133,9 @@ async def test_user_tls(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_TLS"
-    assert result["data"][CONF_DESCRIPTION] == MOCK_TLS_DEVICE_DESCRIPTION
+    assert result["data"][CONF_DESCRIPTION_HASH] == get_description_hash(
+        MOCK_TLS_DEVICE_DESCRIPTION
+    )
     assert result["data"][CONF_HOST] == "Test_Brand-Test_TLS-010203040506070809"
     assert result["data"][CONF_PSK] == MOCK_TLS_DEVICE_INFO["key"]
     assert CONF_AES_IV not in result["data"]
@@ -184,7 +188,9 @@ async def test_user_aes(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_AES"
-    assert result["data"][CONF_DESCRIPTION] == MOCK_AES_DEVICE_DESCRIPTION
+    assert result["data"][CONF_DESCRIPTION_HASH] == get_description_hash(
+        MOCK_AES_DEVICE_DESCRIPTION
+    )
     assert result["data"][CONF_HOST] == "101112131415161718"
     assert result["data"][CONF_PSK] == MOCK_AES_DEVICE_INFO["key"]
     assert result["data"][CONF_AES_IV] == MOCK_AES_DEVICE_INFO["iv"]
@@ -274,7 +280,9 @@ async def test_user_select_device_one(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_AES"
-    assert result["data"][CONF_DESCRIPTION] == MOCK_AES_DEVICE_DESCRIPTION
+    assert result["data"][CONF_DESCRIPTION_HASH] == get_description_hash(
+        MOCK_AES_DEVICE_DESCRIPTION
+    )
     assert result["data"][CONF_HOST] == "101112131415161718"
     assert result["data"][CONF_PSK] == MOCK_AES_DEVICE_INFO["key"]
     assert result["data"][CONF_AES_IV] == MOCK_AES_DEVICE_INFO["iv"]
@@ -715,31 +723,30 @@ async def test_process_profile(
     mock_process_uploaded_file: MagicMock,
 ) -> None:
     """Test processing profile file."""
-    mock_parser = MagicMock()
+    mock_parser = MagicMock(
+        side_effect=lambda description, feature: (description.read(), feature.read())
+    )
     monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
 
-    mock_config_flow = AsyncMock()
+    mock_config_flow = MagicMock()
     mock_config_flow.hass = hass
+    mock_config_flow.profile_file = None
     result = config_flow.HomeConnectConfigFlow._process_profile_file(
         mock_config_flow, UPLOADED_FILE
     )
 
     assert result == {
-        MOCK_TLS_DEVICE_ID: {
-            "info": MOCK_TLS_DEVICE_INFO,
-            "description": mock_parser.return_value,
-        },
-        MOCK_AES_DEVICE_ID: {
-            "info": MOCK_AES_DEVICE_INFO,
-            "description": mock_parser.return_value,
-        },
+        MOCK_TLS_DEVICE_ID: {"info": MOCK_TLS_DEVICE_INFO},
+        MOCK_AES_DEVICE_ID: {"info": MOCK_AES_DEVICE_INFO},
     }
+    mock_parser.assert_not_called()
+    mock_process_uploaded_file.assert_called_with(ANY, UPLOADED_FILE)
 
-    mock_parser.assert_has_calls(
-        [
-            call(b"TLS_DeviceDescription", b"TLS_FeatureMapping"),
-            call(b"AES_DeviceDescription", b"AES_FeatureMapping"),
-        ],
-        any_order=True,
+    profile_file = mock_config_flow.profile_file
+    assert profile_file.exists()
+    assert config_flow.parse_zip_appliance(profile_file, MOCK_TLS_DEVICE_INFO) == (
+        b"TLS_DeviceDescription",
+        b"TLS_FeatureMapping",
     )
-    mock_process_uploaded_file.assert_called_with(ANY, UPLOADED_FILE)
+    mock_parser.assert_called_once()
+    profile_file.unlink()
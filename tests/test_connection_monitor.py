@@ -0,0 +1,86 @@
+"""Tests for the connection monitor."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_components.homeconnect_ws.connection_monitor import RECONNECT_GRACE, ConnectionMonitor
+from homeassistant.util import dt as dt_util
+from homeconnect_websocket.session import ConnectionState
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_connection_transitions(hass: HomeAssistant) -> None:
+    """Test connection transitions are pushed to listeners."""
+    appliance = Mock()
+    appliance.session.connected = True
+    appliance.session.connection_state_callback = None
+
+    monitor = ConnectionMonitor(hass, appliance)
+    monitor.async_start()
+    state_callback = appliance.session.connection_state_callback
+    assert state_callback is not None
+    listener = Mock()
+    remove_listener = monitor.async_add_listener(listener)
+
+    await state_callback(ConnectionState.DISCONNECTED)
+    listener.assert_called_once_with(False)  # noqa: FBT003
+    assert not monitor.connected
+
+    # No transition
+    listener.reset_mock()
+    await state_callback(ConnectionState.CLOSED)
+    listener.assert_not_called()
+
+    await state_callback(ConnectionState.CONNECTED)
+    listener.assert_called_once_with(True)  # noqa: FBT003
+    assert monitor.connected
+
+    listener.reset_mock()
+    remove_listener()
+    await state_callback(ConnectionState.DISCONNECTED)
+    listener.assert_not_called()
+
+    monitor.async_stop()
+    assert appliance.session.connection_state_callback is None
+
+
+async def test_availability(hass: HomeAssistant) -> None:
+    """Test availability is pushed once a disconnect outlasts the grace time."""
+    appliance = Mock()
+    appliance.session.connected = False
+    appliance.session.connection_state_callback = None
+
+    monitor = ConnectionMonitor(hass, appliance)
+    monitor.async_start()
+    state_callback = appliance.session.connection_state_callback
+    listener = Mock()
+    monitor.async_add_availability_listener(listener)
+    assert not monitor.available
+
+    await state_callback(ConnectionState.CONNECTED)
+    assert monitor.available
+    listener.assert_called_once()
+
+    # Reconnected within the grace time
+    listener.reset_mock()
+    await state_callback(ConnectionState.DISCONNECTED)
+    await state_callback(ConnectionState.CONNECTED)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RECONNECT_GRACE))
+    await hass.async_block_till_done()
+    assert monitor.available
+    listener.assert_not_called()
+
+    await state_callback(ConnectionState.DISCONNECTED)
+    assert monitor.available
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RECONNECT_GRACE))
+    await hass.async_block_till_done()
+    assert not monitor.available
+    listener.assert_called_once()
+
+    monitor.async_stop()
@@ -0,0 +1,65 @@
+"""Tests for the connection scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from custom_components.homeconnect_ws import connection_scheduler
+from custom_components.homeconnect_ws.connection_scheduler import ConnectionScheduler
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_bounded_concurrency(hass: HomeAssistant) -> None:
+    """Test connections are limited and prioritized."""
+    scheduler = ConnectionScheduler(hass, max_connections=1)
+    await scheduler._async_load()
+    scheduler.async_set_connected("connected_entry", True)  # noqa: FBT003
+
+    release = asyncio.Event()
+    active = 0
+    max_active = 0
+    order = []
+
+    def create_appliance(name: str) -> Mock:
+        async def connect() -> None:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            order.append(name)
+            await release.wait()
+            active -= 1
+
+        appliance = Mock()
+        appliance.connect = connect
+        return appliance
+
+    tasks = [
+        hass.async_create_task(scheduler.async_connect(name, create_appliance(name)))
+        for name in ("first_entry", "other_entry", "connected_entry")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert max_active == 1
+    assert order == ["first_entry", "connected_entry", "other_entry"]
+
+
+async def test_connect_timeout(hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a stalled handshake releases its connection slot."""
+    monkeypatch.setattr(connection_scheduler, "CONNECT_TIMEOUT", 0)
+    scheduler = ConnectionScheduler(hass, max_connections=1)
+    appliance = Mock()
+    appliance.connect = AsyncMock(side_effect=asyncio.Event().wait)
+
+    with pytest.raises(TimeoutError):
+        await scheduler.async_connect("entry", appliance)
+
+    appliance.connect = AsyncMock()
+    await scheduler.async_connect("entry", appliance)
+    appliance.connect.assert_awaited_once()
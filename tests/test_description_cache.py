@@ -0,0 +1,74 @@
+"""Tests for the Entity description cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from custom_components.homeconnect_ws.description_cache import (
+    EntityDescriptionCache,
+    deserialize_description,
+    get_cache_key,
+    serialize_description,
+    share_entity_descriptions,
+)
+from custom_components.homeconnect_ws.entity_descriptions import get_family_index
+
+from .const import DEVICE_DESCRIPTION, ENTITY_DESCRIPTIONS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+def test_serialize_roundtrip() -> None:
+    """Test serializing and deserializing descriptions."""
+    for descriptions in ENTITY_DESCRIPTIONS.values():
+        for description in descriptions:
+            data = serialize_description(description)
+            assert "class" in data
+            assert deserialize_description(data) == description
+
+
+def test_serialize_static_reference() -> None:
+    """Test static catalogue descriptions are stored as reference."""
+    indexed = next(iter(get_family_index("cooking").static.values()))
+    data = serialize_description(indexed.description)
+    assert data["ref"]["key"] == indexed.description.key
+    assert deserialize_description(data) is indexed.description
+
+
+def test_cache_key() -> None:
+    """Test cache key depends on description and version."""
+    key = get_cache_key(DEVICE_DESCRIPTION, "1.0.0")
+    assert key == get_cache_key(DEVICE_DESCRIPTION, "1.0.0")
+    assert key != get_cache_key(DEVICE_DESCRIPTION, "1.0.1")
+    assert key != get_cache_key({}, "1.0.0")
+    assert key == get_cache_key({**DEVICE_DESCRIPTION, "info": {"deviceID": "other"}}, "1.0.0")
+
+
+def test_share_entity_descriptions() -> None:
+    """Test resolved descriptions are shared, except program descriptions."""
+    shared_descriptions = {}
+    program = []
+    first = share_entity_descriptions(shared_descriptions, "key", {"sensor": [], "program": []})
+    second = share_entity_descriptions(
+        shared_descriptions, "key", {"sensor": [], "program": program}
+    )
+
+    assert first["sensor"] is second["sensor"]
+    assert second["program"] is program
+
+
+async def test_cache(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test storing and loading descriptions."""
+    cache = EntityDescriptionCache(hass, "entry_id")
+    assert await cache.async_load("key", mock_appliance) is None
+
+    await cache.async_save("key", {"sensor": ENTITY_DESCRIPTIONS["sensor"]})
+    cached = await cache.async_load("key", mock_appliance)
+    assert cached["sensor"] == ENTITY_DESCRIPTIONS["sensor"]
+    assert "program" in cached
+    assert await cache.async_load("other_key", mock_appliance) is None
+
+    await cache.async_remove()
+    assert await cache.async_load("key", mock_appliance) is None
@@ -0,0 +1,53 @@
+"""Tests for the device description store."""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+from custom_components.homeconnect_ws.description_store import (
+    DescriptionStore,
+    get_description_hash,
+    intern_description,
+)
+
+from .const import DEVICE_DESCRIPTION
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_description_store(hass: HomeAssistant) -> None:
+    """Test identical descriptions are stored once."""
+    store = DescriptionStore(hass)
+
+    description_hash = await store.async_add(DEVICE_DESCRIPTION)
+    assert description_hash == get_description_hash(DEVICE_DESCRIPTION)
+    assert await store.async_add(copy.deepcopy(DEVICE_DESCRIPTION)) == description_hash
+    assert await store.async_get(description_hash) == DEVICE_DESCRIPTION
+
+    other_hash = await store.async_add({"info": {}})
+    assert other_hash != description_hash
+
+    await store.async_remove_unused({description_hash})
+    assert await store.async_get(description_hash) == DEVICE_DESCRIPTION
+    assert await store.async_get(other_hash) is None
+
+    # descriptions are persisted
+    assert await DescriptionStore(hass).async_get(description_hash) == DEVICE_DESCRIPTION
+
+
+def test_intern_description() -> None:
+    """Test identical appliance models share the Entity sections."""
+    description = copy.deepcopy(DEVICE_DESCRIPTION)
+    description["info"]["deviceID"] = "other_device"
+
+    first = intern_description(DEVICE_DESCRIPTION)
+    second = intern_description(description)
+
+    assert first == DEVICE_DESCRIPTION
+    assert second == description
+    for section in ("status", "setting", "option"):
+        assert first[section] is second[section]
+    assert first["info"] is not second["info"]
+    assert first["info"] is not DEVICE_DESCRIPTION["info"]
@@ -0,0 +1,110 @@
+"""Tests for the zeroconf discovery cache."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, Mock
+
+from custom_components import homeconnect_ws
+from custom_components.homeconnect_ws.const import DOMAIN
+from custom_components.homeconnect_ws.discovery_cache import (
+    DISCOVERY_DEBOUNCE,
+    DiscoveryCache,
+    async_update_host,
+)
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST
+from homeassistant.util import dt as dt_util
+from homeconnect_websocket.session import HCSession
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from . import setup_config_entry
+from .const import MOCK_CONFIG_DATA, MOCK_TLS_DEVICE_ID
+
+if TYPE_CHECKING:
+    import pytest
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+async def test_debounced_host_update(hass: HomeAssistant) -> None:
+    """Test repeated announcements are ignored and host changes are debounced."""
+    mock_config = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    mock_config.add_to_hass(hass)
+    cache = DiscoveryCache(hass)
+
+    cache.async_discovered(mock_config, "1.2.3.4")
+    cache.async_discovered(mock_config, "1.2.3.4")
+    assert cache.ignored_announcements == 1
+
+    cache.async_discovered(mock_config, "5.6.7.8")
+    cache.async_discovered(mock_config, "5.6.7.8")
+    assert cache.ignored_announcements == 2
+    assert mock_config.data[CONF_HOST] == "1.2.3.4"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=DISCOVERY_DEBOUNCE + 1))
+    await hass.async_block_till_done()
+
+    assert mock_config.data[CONF_HOST] == "5.6.7.8"
+    assert cache.host_updates == 1
+
+
+async def test_host_change_reverted(hass: HomeAssistant) -> None:
+    """Test a host change is dropped when the previous IP is announced again."""
+    mock_config = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    mock_config.add_to_hass(hass)
+    cache = DiscoveryCache(hass)
+
+    cache.async_discovered(mock_config, "5.6.7.8")
+    cache.async_discovered(mock_config, "1.2.3.4")
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=DISCOVERY_DEBOUNCE + 1))
+    await hass.async_block_till_done()
+
+    assert mock_config.data[CONF_HOST] == "1.2.3.4"
+    assert cache.host_updates == 0
+
+
+async def test_update_host_reconnects(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a loaded entry reconnects to the new host without a reload."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    assert entry.state is ConfigEntryState.LOADED
+    old_session = mock_appliance.session
+    new_session = AsyncMock(spec=HCSession)
+    create_session = Mock(return_value=new_session)
+    monkeypatch.setattr(homeconnect_ws, "HCSession", create_session)
+
+    async_update_host(hass, entry, "5.6.7.8")
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.data[CONF_HOST] == "5.6.7.8"
+    homeconnect_ws.HomeAppliance.assert_called_once()
+    old_session.close.assert_awaited_once()
+    assert create_session.call_args.kwargs["host"] == "5.6.7.8"
+    assert mock_appliance.session is new_session
+    new_session.connect.assert_awaited_once()
+    assert new_session.connection_state_callback is not None
+
+    # Updates keeping the host don't reconnect
+    hass.config_entries.async_update_entry(entry, title="Renamed")
+    await hass.async_block_till_done()
+    create_session.assert_called_once()
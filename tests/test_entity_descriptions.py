@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
+import pytest
 from custom_components.homeconnect_ws import entity_descriptions
 from custom_components.homeconnect_ws.entity_descriptions import (
     HCBinarySensorEntityDescription,
@@ -16,22 +17,29 @@ from custom_components.homeconnect_ws.entity_descriptions.common import (
     generate_power_switch,
     generate_program,
 )
-from custom_components.homeconnect_ws.helpers import merge_dicts
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.switch import SwitchDeviceClass
 from homeconnect_websocket.entities import Access, DeviceDescription, EntityDescription
 
 if TYPE_CHECKING:
-    import pytest
     from homeconnect_websocket.testutils import MockAppliance, MockApplianceType
 
 
-def test_merge_dicts() -> None:
-    """Test merge dicts."""
-    dict1 = {"a": [1, 2], "b": [3, 4]}
-    dict2 = {"b": [5, 6], "c": [7, 8]}
-    out_dict = merge_dicts(dict1, dict2)
-    assert out_dict == {"a": [1, 2], "b": [3, 4, 5, 6], "c": [7, 8]}
+def test_build_catalogue() -> None:
+    """Test building the immutable catalogue."""
+    switch = HCSwitchEntityDescription(key="switch", entity="Test.Switch")
+    switch_alternative = HCSwitchEntityDescription(key="switch", entity="Test.Switch.Other")
+    definitions_1 = {"switch": [switch]}
+    definitions_2 = {"switch": [switch, switch_alternative]}
+    catalogue = entity_descriptions.build_catalogue(definitions_1, definitions_2)
+    assert catalogue == {"switch": (switch, switch_alternative)}
+    assert definitions_1 == {"switch": [switch]}
+    with pytest.raises(TypeError):
+        catalogue["switch"] = ()
+
+    all_descriptions = entity_descriptions.get_all_entity_description()
+    assert entity_descriptions.get_all_entity_description() is all_descriptions
+    assert all(isinstance(descriptions, tuple) for descriptions in all_descriptions.values())
 
 
 MOCK_ENTITY_DESCRIPTIONS = {
@@ -66,9 +74,10 @@ def test_get_available_entities(
     """Test get_available_entities."""
     monkeypatch.setattr(
         entity_descriptions,
-        "get_all_entity_description",
+        "get_family_descriptions",
         Mock(return_value=MOCK_ENTITY_DESCRIPTIONS),
     )
+    monkeypatch.setattr(entity_descriptions, "get_families", Mock(return_value=["common"]))
     entities = entity_descriptions.get_available_entities(mock_appliance)
     assert entities["binary_sensor"] == [
         HCBinarySensorEntityDescription(key="binary_sensor_available", entity="Test.BinarySensor")
@@ -84,6 +93,47 @@ def test_get_available_entities(
     ]
 
 
+def test_description_index(mock_appliance: MockAppliance) -> None:
+    """Test DescriptionIndex lookup."""
+    index = entity_descriptions.DescriptionIndex(MOCK_ENTITY_DESCRIPTIONS)
+    assert set(index.by_entity) == {"Test.BinarySensor", "Test.BinarySensor2", "Test.Event1"}
+    assert index.unconditional == []
+    assert index.generators == []
+
+    matches = sorted(index.lookup(mock_appliance.entities), key=lambda match: match.position)
+    assert [match.description.key for match in matches] == [
+        "binary_sensor_available",
+        "sensor_event_available",
+    ]
+    assert matches[1].required_entities == frozenset({"Test.Event1", "Test.Event2"})
+
+
+def test_get_families() -> None:
+    """Test description families are selected by entity namespace."""
+    assert entity_descriptions.get_families(["BSH.Common.Status.DoorState"]) == ["common"]
+    assert entity_descriptions.get_families(
+        ["BSH.Common.Status.DoorState", "Dishcare.Dishwasher.Status.SaltNearlyEmpty"]
+    ) == ["common", "dishcare"]
+
+
+def test_static_reference() -> None:
+    """Test static descriptions are found by their reference."""
+    index = entity_descriptions.get_family_index("dishcare")
+    position, indexed = next(iter(index.static.items()))
+    assert position > entity_descriptions.FAMILY_POSITION_OFFSET
+    reference = entity_descriptions.get_static_reference(indexed.description)
+    assert reference == {
+        "family": "dishcare",
+        "type": indexed.description_type,
+        "key": indexed.description.key,
+        "entities": sorted(indexed.required_entities),
+    }
+    assert entity_descriptions.get_static_description(reference) is indexed.description
+
+    with pytest.raises(KeyError):
+        entity_descriptions.get_static_description({**reference, "key": "missing"})
+
+
 POWER_SWITCH = {
     "setting": [
         {
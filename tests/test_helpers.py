@@ -2,37 +2,76 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
+import pytest
+from custom_components.homeconnect_ws.const import PLATFORMS
 from custom_components.homeconnect_ws.helpers import (
-    EntityMatch,
-    get_entities_from_regex,
-    get_groups_from_regex,
+    EntityTree,
+    get_entity_tree,
+    get_enum_options,
+    get_required_platforms,
 )
+from homeassistant.const import Platform
 
-from .const import DEVICE_DESCRIPTION
+from .const import DEVICE_DESCRIPTION, ENTITY_DESCRIPTIONS
 
 if TYPE_CHECKING:
     from homeconnect_websocket.testutils import MockApplianceType
 
 
-async def test_get_entities_from_regex(mock_homeconnect_appliance: MockApplianceType) -> None:
-    """Test get_entities_from_regex helper."""
+async def test_get_entity_tree(mock_homeconnect_appliance: MockApplianceType) -> None:
+    """Test get_entity_tree helper."""
     appliance = await mock_homeconnect_appliance(description=DEVICE_DESCRIPTION)
-    pattern = re.compile(r"^Test\.RegEx\.(.*)\..*$")
-    result = get_entities_from_regex(appliance, pattern)
-    assert result == [
-        EntityMatch(entity="Test.RegEx.001.Sensor", groups=("001",)),
-        EntityMatch(entity="Test.RegEx.002.Sensor", groups=("002",)),
-        EntityMatch(entity="Test.RegEx.001.Switch", groups=("001",)),
-        EntityMatch(entity="Test.RegEx.002.Switch", groups=("002",)),
+    tree = get_entity_tree(appliance)
+    assert get_entity_tree(appliance) is tree
+    assert tree.get_groups("Test.RegEx") == ["001", "002"]
+    assert tree.get_groups("Test.Missing") == []
+
+
+def test_entity_tree() -> None:
+    """Test EntityTree."""
+    tree = EntityTree(
+        [
+            "Cooking.Hob.Status.Zone.1.State",
+            "Cooking.Hob.Status.Zone.1.ElapsedProgramTime",
+            "Cooking.Hob.Status.Zone.1.ElapsedProgramTime.AutoCounting",
+            "Cooking.Hob.Status.Zone.2.State",
+            "Cooking.Hob.Status.Zone.Name.State",
+            "Cooking.Hob.Status.Zone.3",
+        ]
+    )
+    assert tree.get_groups("Cooking.Hob.Status.Zone") == ["1", "2"]
+    assert tree.get_groups("Cooking.Hob.Status.Zone", numeric=False) == ["1", "2", "Name"]
+    assert tree.get_node("Cooking.Hob.Status.Zone.1.ElapsedProgramTime").is_entity
+    assert not tree.get_node("Cooking.Hob.Status.Zone.1").is_entity
+    assert tree.get_node("Cooking.Oven") is None
+    assert tree.get_entity_names("Cooking.Hob.Status.Zone.1") == [
+        "Cooking.Hob.Status.Zone.1.ElapsedProgramTime",
+        "Cooking.Hob.Status.Zone.1.ElapsedProgramTime.AutoCounting",
+        "Cooking.Hob.Status.Zone.1.State",
     ]
+    assert tree.get_entity_names("Cooking.Hob.Status.Zone.3") == ["Cooking.Hob.Status.Zone.3"]
+    assert tree.get_entity_names("Cooking.Oven") == []
 
 
-async def test_get_groups_from_regex(mock_homeconnect_appliance: MockApplianceType) -> None:
-    """Test get_groups_from_regex helper."""
-    appliance = await mock_homeconnect_appliance(description=DEVICE_DESCRIPTION)
-    pattern = re.compile(r"^Test\.RegEx\.(.*)\..*$")
-    result = get_groups_from_regex(appliance, pattern)
-    assert result == {("001",), ("002",)}
+def test_get_required_platforms() -> None:
+    """Test get_required_platforms helper."""
+    assert get_required_platforms({}) == [Platform.BINARY_SENSOR]
+    descriptions = {"light": [], "program": ENTITY_DESCRIPTIONS["program"]}
+    assert get_required_platforms(descriptions) == [Platform.BINARY_SENSOR, Platform.SELECT]
+    assert get_required_platforms(ENTITY_DESCRIPTIONS) == PLATFORMS
+
+
+def test_get_enum_options() -> None:
+    """Test enum options are shared."""
+    enum_options = get_enum_options({0: "Off", 1: "On"}, lowercase=True)
+    assert enum_options.options == ("off", "on")
+    assert enum_options.rev_options == {"off": "Off", "on": "On"}
+    assert get_enum_options({0: "Off", 1: "On"}, lowercase=True) is enum_options
+    with pytest.raises(TypeError):
+        enum_options.rev_options["off"] = "On"
+
+    enum_options = get_enum_options({0: "Off", 1: "On"}, lowercase=False)
+    assert enum_options.options == ("Off", "On")
+    assert enum_options.rev_options == {}
@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
+import pytest
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
 from custom_components import homeconnect_ws
-from custom_components.homeconnect_ws.const import DOMAIN
+from custom_components.homeconnect_ws.const import CONF_DESCRIPTION_HASH, DOMAIN
+from custom_components.homeconnect_ws.description_store import get_description_hash
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_DESCRIPTION, STATE_UNAVAILABLE
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeconnect_websocket import CodeResponsError
+from homeconnect_websocket.entities import Access
 from homeconnect_websocket.testutils import MockAppliance
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from . import setup_config_entry
 from .const import DEVICE_DESCRIPTION, MOCK_CONFIG_DATA, MOCK_TLS_DEVICE_ID
 
 if TYPE_CHECKING:
-    import pytest
     from homeassistant.core import HomeAssistant
 
 
@@ -98,3 +106,168 @@ async def test_load_failure(
     assert entry.state is ConfigEntryState.SETUP_RETRY
     appliance.session.close.assert_awaited_once()
     await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_deferred_setup(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test setup from stored descriptions while the appliance is unreachable."""
+    description = {
+        **DEVICE_DESCRIPTION,
+        "selectedProgram": {
+            **DEVICE_DESCRIPTION["selectedProgram"],
+            "name": "BSH.Common.Root.SelectedProgram",
+        },
+        "activeProgram": {
+            **DEVICE_DESCRIPTION["activeProgram"],
+            "name": "BSH.Common.Root.ActiveProgram",
+        },
+    }
+    appliance = MockAppliance(description, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+    get_available_entities = Mock(wraps=homeconnect_ws.get_available_entities)
+    monkeypatch.setattr(homeconnect_ws, "get_available_entities", get_available_entities)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    entity_registry = er.async_get(hass)
+    entity_ids = {
+        entity_entry.unique_id.rsplit("-", 1)[1]: entity_entry.entity_id
+        for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    }
+    assert hass.states.get(entity_ids["select_program"]).state != STATE_UNAVAILABLE
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    appliance.session.reset_mock()
+
+    appliance.session.connected = False
+    appliance.session.connect.side_effect = TimeoutError()
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    appliance.session.connect.assert_awaited_once()
+    # Entities are created from the stored descriptions
+    get_available_entities.assert_called_once()
+    assert hass.states.get(entity_ids["select_program"]).state == STATE_UNAVAILABLE
+    assert hass.states.get(entity_ids["sensor_active_program"]).state == STATE_UNAVAILABLE
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_description_moved_to_store(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the migration moves the description from the entry to the description store."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    appliance_mock = Mock(return_value=appliance)
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", appliance_mock)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+        version=1,
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.version == 2
+    assert CONF_DESCRIPTION not in entry.data
+    assert entry.data[CONF_DESCRIPTION_HASH] == get_description_hash(DEVICE_DESCRIPTION)
+    assert appliance_mock.call_args.kwargs["description"] == DEVICE_DESCRIPTION
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_get_snapshot_service(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test get_snapshot service."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, mock_appliance.info["deviceID"])}
+    )
+    await mock_appliance.entities["Test.Switch"].update({"value": True})
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_snapshot",
+        {"device_id": device.id, "namespaces": ["Test.Switch"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert list(response["entities"]) == ["Test.Switch", "Test.Switch.Enum"]
+    assert response["entities"]["Test.Switch"] == {
+        "uid": 201,
+        "value": True,
+        "access": Access.READ_WRITE,
+        "available": True,
+    }
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_snapshot",
+        {"device_id": device.id, "entities": ["Test.Number"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert list(response["entities"]) == ["Test.Number"]
+
+    response = await hass.services.async_call(
+        DOMAIN, "get_snapshot", {"device_id": device.id}, blocking=True, return_response=True
+    )
+    assert len(response["entities"]) == len(mock_appliance.entities)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "get_snapshot",
+            {"device_id": device.id, "entities": ["Test.Missing"]},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_deferred_connect_retry(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the deferred connection is retried with a new session after failures."""
+    monkeypatch.setattr(homeconnect_ws, "DEFERRED_RETRY_MIN", 0)
+    sessions = [Mock(connected=False), Mock(connected=True)]
+    create_session = Mock(side_effect=sessions)
+    monkeypatch.setattr(homeconnect_ws, "HCSession", create_session)
+    hass.data[homeconnect_ws.HC_KEY] = homeconnect_ws.HCConfig(
+        connection_scheduler=Mock(
+            async_connect=AsyncMock(side_effect=[CodeResponsError(400, "/ci/info"), None, None])
+        )
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG_DATA)
+    entry.runtime_data = Mock()
+    appliance = MagicMock(close=AsyncMock())
+
+    await homeconnect_ws._async_deferred_connect(hass, entry, appliance)
+    # Unexpected error and failed handshake are retried, each with a new session
+    assert hass.data[homeconnect_ws.HC_KEY].connection_scheduler.async_connect.await_count == 3
+    assert appliance.close.await_count == 2
+    assert create_session.call_count == 2
+    assert appliance.session is sessions[1]
+    assert entry.runtime_data.connection_monitor.async_start.call_count == 2
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
+from custom_components.homeconnect_ws import light
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_BRIGHTNESS_PCT,
@@ -30,6 +32,7 @@ from . import setup_config_entry
 from .const import MOCK_CONFIG_DATA
 
 if TYPE_CHECKING:
+    import pytest
     from homeassistant.core import HomeAssistant
     from homeconnect_websocket.testutils import MockAppliance
 
@@ -599,6 +602,32 @@ async def test_update_color(
     assert state.attributes[ATTR_RGB_COLOR] == (255, 0, 0)
 
 
+async def test_color_parsed_once_per_update(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test RGB value is only parsed once per update."""
+    parse_mock = Mock(side_effect=light.rgb_hex_to_rgb_list)
+    monkeypatch.setattr(light, "rgb_hex_to_rgb_list", parse_mock)
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    await mock_appliance.entities["Test.Lighting"].update({"value": True})
+    await mock_appliance.entities["Test.LightingCustomColor"].update({"value": "#ff0000"})
+    await hass.async_block_till_done()
+    parse_mock.reset_mock()
+
+    state = hass.states.get("light.fake_brand_homeappliance_light_4")
+    assert state.attributes[ATTR_RGB_COLOR] == (255, 0, 0)
+    await mock_appliance.entities["Test.LightingCustomColor"].update({"value": "#7f0000"})
+    await hass.async_block_till_done()
+
+    state = hass.states.get("light.fake_brand_homeappliance_light_4")
+    assert state.attributes[ATTR_BRIGHTNESS] == 127
+    assert state.attributes[ATTR_RGB_COLOR] == (255, 0, 0)
+    parse_mock.assert_called_once_with("7f0000")
+
+
 async def test_set_color(
     hass: HomeAssistant,
     mock_appliance: MockAppliance,
@@ -0,0 +1,113 @@
+"""Tests for the network info sampler."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, Mock
+
+from custom_components.homeconnect_ws.network_sampler import (
+    MAX_INTERVAL,
+    MIN_INTERVAL,
+    NetworkInfoSampler,
+)
+from homeconnect_websocket import CodeResponsError, NotConnectedError
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_shared_request(hass: HomeAssistant) -> None:
+    """Test concurrent calls share one request."""
+    request_done = asyncio.Event()
+
+    async def get_network_config() -> list[dict]:
+        await request_done.wait()
+        return [{"rssi": -50}]
+
+    appliance = Mock()
+    appliance.get_network_config = AsyncMock(side_effect=get_network_config)
+    sampler = NetworkInfoSampler(hass, appliance, Mock())
+
+    tasks = [hass.async_create_task(sampler.async_get_network_info()) for _ in range(3)]
+    await asyncio.sleep(0)
+    request_done.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == [[{"rssi": -50}]] * 3
+    appliance.get_network_config.assert_awaited_once()
+
+
+async def test_request_error(hass: HomeAssistant) -> None:
+    """Test request errors."""
+    appliance = Mock()
+    appliance.get_network_config = AsyncMock(side_effect=NotConnectedError)
+    sampler = NetworkInfoSampler(hass, appliance, Mock())
+    assert await sampler.async_get_network_info() is None
+
+    appliance.get_network_config.side_effect = TimeoutError
+    assert await sampler.async_get_network_info() is None
+
+    appliance.get_network_config.side_effect = CodeResponsError(400, "/ci/networkDetails")
+    assert await sampler.async_get_network_info() is None
+
+
+async def test_adaptive_interval(hass: HomeAssistant) -> None:
+    """Test interval backs off while the RSSI is stable."""
+    sampler = NetworkInfoSampler(hass, Mock(), Mock())
+    assert sampler.statistics == {"rssi_min": None, "rssi_avg": None, "rssi_max": None}
+
+    sampler._add_sample(-60)
+    assert sampler.interval == MIN_INTERVAL
+    sampler._add_sample(-61)
+    assert sampler.interval == MIN_INTERVAL * 2
+    for _ in range(10):
+        sampler._add_sample(-60)
+    assert sampler.interval == MAX_INTERVAL
+
+    sampler._add_sample(-70)
+    assert sampler.interval == MIN_INTERVAL
+    assert sampler.rssi == -70
+    assert sampler.statistics["rssi_min"] == -70
+    assert sampler.statistics["rssi_max"] == -60
+
+
+async def test_sampling(hass: HomeAssistant) -> None:
+    """Test sampling runs while there are listeners and the appliance is connected."""
+    appliance = Mock()
+    appliance.get_network_config = AsyncMock(return_value=[{"rssi": -55}])
+    connection_monitor = Mock()
+    connection_monitor.connected = False
+    sampler = NetworkInfoSampler(hass, appliance, connection_monitor)
+
+    listener = Mock()
+    remove_listener = sampler.async_add_listener(listener)
+    await hass.async_block_till_done()
+    appliance.get_network_config.assert_not_awaited()
+
+    connection_listener = connection_monitor.async_add_listener.call_args[0][0]
+    connection_monitor.connected = True
+    connection_listener(True)  # noqa: FBT003
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+    appliance.get_network_config.assert_awaited_once()
+    listener.assert_called_once()
+    assert sampler.rssi == -55
+
+    remove_listener()
+    connection_monitor.async_add_listener.return_value.assert_called_once()
+
+
+async def test_sampling_after_error(hass: HomeAssistant) -> None:
+    """Test sampling is rescheduled after a failed request."""
+    appliance = Mock()
+    appliance.get_network_config = AsyncMock(side_effect=TimeoutError)
+    connection_monitor = Mock()
+    connection_monitor.connected = True
+    sampler = NetworkInfoSampler(hass, appliance, connection_monitor)
+    sampler.async_add_listener(Mock())
+
+    await sampler._async_timer_fired(None)
+    appliance.get_network_config.assert_awaited_once()
+    assert sampler._cancel_timer is not None
+    sampler.async_stop()
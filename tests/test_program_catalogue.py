@@ -0,0 +1,68 @@
+"""Tests for the program catalogue."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_components.homeconnect_ws.program_catalogue import (
+    ProgramCatalogue,
+    get_program_catalogue,
+)
+from homeconnect_websocket.entities import Execution
+
+from .test_entity_descriptions import PROGRAM
+
+if TYPE_CHECKING:
+    from homeconnect_websocket.testutils import MockApplianceType
+
+
+async def test_program_catalogue(mock_homeconnect_appliance: MockApplianceType) -> None:
+    """Test catalogue created from an appliance."""
+    appliance = await mock_homeconnect_appliance(description=PROGRAM)
+    catalogue = ProgramCatalogue.from_appliance(appliance)
+
+    assert catalogue == {
+        "BSH.Common.Program.Favorite.001": "Named Favorite",
+        "BSH.Common.Program.Favorite.002": "favorite_002",
+        "BSH.Common.Program.Program1": "bsh_common_program_program1",
+    }
+    assert catalogue.options == ["Named Favorite", "favorite_002", "bsh_common_program_program1"]
+    assert catalogue.rev_programs["favorite_002"] == "BSH.Common.Program.Favorite.002"
+    assert catalogue.executions == {
+        Execution.SELECT_AND_START: (
+            "BSH.Common.Program.Favorite.001",
+            "BSH.Common.Program.Favorite.002",
+            "BSH.Common.Program.Program1",
+        )
+    }
+    assert get_program_catalogue(catalogue) is catalogue
+    assert get_program_catalogue({"Program": "program"}).options == ["program"]
+
+
+async def test_program_catalogue_rename(mock_homeconnect_appliance: MockApplianceType) -> None:
+    """Test favorite renamed in place."""
+    appliance = await mock_homeconnect_appliance(description=PROGRAM)
+    catalogue = ProgramCatalogue.from_appliance(appliance)
+    options = catalogue.options
+    listener = Mock()
+    remove_listener = catalogue.async_add_listener(listener)
+    catalogue.async_start()
+
+    name_entity = appliance.settings["BSH.Common.Setting.Favorite.002.Name"]
+    await name_entity.update({"value": "My Favorite"})
+    await catalogue._async_favorite_renamed(name_entity)
+
+    assert catalogue.options is not options
+    assert options == ["Named Favorite", "favorite_002", "bsh_common_program_program1"]
+    assert catalogue.options == ["Named Favorite", "My Favorite", "bsh_common_program_program1"]
+    assert catalogue["BSH.Common.Program.Favorite.002"] == "My Favorite"
+    assert catalogue.rev_programs["My Favorite"] == "BSH.Common.Program.Favorite.002"
+    assert "favorite_002" not in catalogue.rev_programs
+    listener.assert_called_once()
+
+    remove_listener()
+    await name_entity.update({"value": "Other Favorite"})
+    await catalogue._async_favorite_renamed(name_entity)
+    listener.assert_called_once()
+    catalogue.async_stop()
@@ -8,18 +8,22 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
-from custom_components.homeconnect_ws import config_flow
+from custom_components.homeconnect_ws import config_flow, get_description_store
 from custom_components.homeconnect_ws.const import (
     CONF_AES_IV,
+    CONF_DESCRIPTION_HASH,
     CONF_FILE,
     CONF_PSK,
     DOMAIN,
 )
+from custom_components.homeconnect_ws.description_store import get_description_hash
+from homeassistant.const import CONF_DESCRIPTION, CONF_HOST
 from homeassistant.data_entry_flow import FlowResultType
 from homeconnect_websocket import ParserError
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from .const import (
+    MOCK_AES_DEVICE_DESCRIPTION,
     MOCK_AES_DEVICE_ID,
     MOCK_CONFIG_DATA,
 )
@@ -67,11 +71,56 @@ async def test_reauth(
     assert result["reason"] == "reauth_successful"
     assert mock_config.data[CONF_PSK] == "New_AES_PSK_KEY"
     assert mock_config.data[CONF_AES_IV] == "New_AES_IV"
+    assert mock_config.data[CONF_DESCRIPTION_HASH] == get_description_hash(
+        MOCK_AES_DEVICE_DESCRIPTION
+    )
 
     mock_hc_socket.return_value.connect.assert_awaited_once()
     mock_hc_socket.return_value.close.assert_awaited_once()
 
 
+async def test_reauth_prunes_replaced_description(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the description replaced by a reauthentication is removed from the store."""
+    hc_socket = Mock()
+    hc_socket.AesSocket = Mock(return_value=AsyncMock())
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+
+    mock_process_profile_file.return_value[MOCK_AES_DEVICE_ID]["info"]["key"] = "New_AES_PSK_KEY"
+    mock_process_profile_file.return_value[MOCK_AES_DEVICE_ID]["info"]["iv"] = "New_AES_IV"
+
+    description_store = get_description_store(hass)
+    old_description = {"info": {"vib": "Test_vib"}, "status": ["OLD_STATUS"]}
+    old_hash = await description_store.async_add(old_description)
+    data = {key: value for key, value in MOCK_CONFIG_DATA.items() if key != CONF_DESCRIPTION}
+    data[CONF_DESCRIPTION_HASH] = old_hash
+    mock_config = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        unique_id=MOCK_AES_DEVICE_ID,
+        version=2,
+    )
+    mock_config.add_to_hass(hass)
+
+    result = await mock_config.start_reauth_flow(hass)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    new_hash = mock_config.data[CONF_DESCRIPTION_HASH]
+    assert new_hash != old_hash
+    assert await description_store.async_get(old_hash) is None
+    assert await description_store.async_get(new_hash) == MOCK_AES_DEVICE_DESCRIPTION
+
+
 async def test_reauth_appliance_not_in_profile(
     hass: HomeAssistant,
     mock_process_profile_file: MagicMock,  # noqa: ARG001
@@ -208,7 +257,12 @@ async def test_reauth_connection_failed_timeout(
     assert result["step_id"] == "host"
     assert result["errors"]["base"] == "cannot_connect"
 
-    mock_hc_socket.return_value.close.assert_awaited_once()
+    # the configured host and the host derived from the profile file are tried
+    assert [call.args[0] for call in mock_hc_socket.call_args_list] == [
+        MOCK_CONFIG_DATA[CONF_HOST],
+        MOCK_AES_DEVICE_ID,
+    ]
+    assert mock_hc_socket.return_value.close.await_count == 2
     hass.config_entries.flow.async_abort(result["flow_id"])
     mock_setup_entry.assert_not_awaited()
 
@@ -246,7 +300,12 @@ async def test_reauth_connection_failed_connection_error(
     assert result["step_id"] == "host"
     assert result["errors"]["base"] == "cannot_connect"
 
-    mock_hc_socket.return_value.close.assert_awaited_once()
+    # the configured host and the host derived from the profile file are tried
+    assert [call.args[0] for call in mock_hc_socket.call_args_list] == [
+        MOCK_CONFIG_DATA[CONF_HOST],
+        MOCK_AES_DEVICE_ID,
+    ]
+    assert mock_hc_socket.return_value.close.await_count == 2
     hass.config_entries.flow.async_abort(result["flow_id"])
     mock_setup_entry.assert_not_awaited()
 
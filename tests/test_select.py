@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
+from custom_components import homeconnect_ws
+from custom_components.homeconnect_ws.program_catalogue import ProgramCatalogue
 from homeassistant.components.select import (
     ATTR_OPTION,
     ATTR_OPTIONS,
@@ -14,9 +18,10 @@ from homeassistant.const import ATTR_ENTITY_ID, ATTR_FRIENDLY_NAME, STATE_UNKNOW
 from homeconnect_websocket.message import Action, Message
 
 from . import setup_config_entry
-from .const import MOCK_CONFIG_DATA
+from .const import ENTITY_DESCRIPTIONS, MOCK_CONFIG_DATA
 
 if TYPE_CHECKING:
+    import pytest
     from homeassistant.core import HomeAssistant
     from homeconnect_websocket.testutils import MockAppliance
 
@@ -237,3 +242,63 @@ async def test_select_program(
             },
         )
     )
+
+
+async def test_rename_favorite_program(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test renamed favorite programs are updated without reloading."""
+    catalogue = ProgramCatalogue.from_appliance(mock_appliance)
+    descriptions = {
+        "program": [replace(ENTITY_DESCRIPTIONS["program"][0], mapping=catalogue)],
+        "active_program": [replace(ENTITY_DESCRIPTIONS["active_program"][0], mapping=catalogue)],
+    }
+    monkeypatch.setattr(homeconnect_ws, "get_available_entities", Mock(return_value=descriptions))
+    entity_id = "select.fake_brand_homeappliance_selectedprogram"
+    sensor_entity_id = "sensor.fake_brand_homeappliance_activeprogram"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    await mock_appliance.entities["Test.SelectedProgram"].update({"value": 503})
+    await mock_appliance.entities["Test.ActiveProgram"].update({"value": 503})
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.state == "favorite_002"
+
+    await mock_appliance.entities["BSH.Common.Setting.Favorite.002.Name"].update(
+        {"value": "My Favorite"}
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.state == "My Favorite"
+    assert "My Favorite" in state.attributes[ATTR_OPTIONS]
+    assert "favorite_002" not in state.attributes[ATTR_OPTIONS]
+    state = hass.states.get(sensor_entity_id)
+    assert state.state == "My Favorite"
+    assert "My Favorite" in state.attributes[ATTR_OPTIONS]
+
+    await hass.services.async_call(
+        SELECT_DOMAIN,
+        SERVICE_SELECT_OPTION,
+        {
+            ATTR_ENTITY_ID: entity_id,
+            ATTR_OPTION: "My Favorite",
+        },
+        blocking=True,
+    )
+    assert mock_appliance.session.send_sync.await_args.args[0].data["program"] == 503
+
+    # a favorite that isn't selected is renamed in the options
+    last_updated = hass.states.get(entity_id).last_updated
+    await mock_appliance.entities["BSH.Common.Setting.Favorite.001.Name"].update(
+        {"value": "Other Favorite"}
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.attributes[ATTR_OPTIONS][0] == "Other Favorite"
+    assert state.last_updated > last_updated
+    state = hass.states.get(sensor_entity_id)
+    assert state.attributes[ATTR_OPTIONS][0] == "Other Favorite"
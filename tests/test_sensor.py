@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
+from custom_components import homeconnect_ws
+from custom_components.homeconnect_ws.entity_descriptions import HCSensorEntityDescription
 from homeassistant.components.sensor import ATTR_OPTIONS
 from homeassistant.const import ATTR_FRIENDLY_NAME
 
@@ -11,6 +14,7 @@ from . import setup_config_entry
 from .const import MOCK_CONFIG_DATA
 
 if TYPE_CHECKING:
+    import pytest
     from homeassistant.core import HomeAssistant
     from homeconnect_websocket.testutils import MockAppliance
 
@@ -145,3 +149,38 @@ async def test_update_active_program(
 
     state = hass.states.get(entity_id)
     assert state.state == "Named Favorite"
+
+
+async def test_extra_attributes(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test extra attributes are updated from their source entity."""
+    descriptions = {
+        "sensor": [
+            HCSensorEntityDescription(
+                key="Test.Sensor",
+                name="Sensor",
+                entity="Test.Sensor",
+                extra_attributes=[
+                    {"name": "number", "entity": "Test.Number"},
+                    {
+                        "name": "number_doubled",
+                        "entity": "Test.Number",
+                        "value_fn": lambda entity: entity.value * 2,
+                    },
+                ],
+            )
+        ]
+    }
+    monkeypatch.setattr(homeconnect_ws, "get_available_entities", Mock(return_value=descriptions))
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+
+    await mock_appliance.entities["Test.Number"].update({"value": 5})
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.fake_brand_homeappliance_sensor")
+    assert state
+    assert state.attributes["number"] == 5
+    assert state.attributes["number_doubled"] == 10
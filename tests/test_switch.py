@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from custom_components.homeconnect_ws.connection_monitor import RECONNECT_GRACE
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -12,9 +14,13 @@ from homeassistant.const import (
     SERVICE_TURN_ON,
     STATE_OFF,
     STATE_ON,
+    STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
+from homeassistant.util import dt as dt_util
 from homeconnect_websocket.message import Action, Message
+from homeconnect_websocket.session import ConnectionState
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from . import setup_config_entry
 from .const import MOCK_CONFIG_DATA
@@ -93,6 +99,51 @@ async def test_update_enum(
     assert state.state == STATE_ON
 
 
+async def test_available(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test availability follows the HC entity."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+
+    await mock_appliance.entities["Test.Switch"].update({"available": False})
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+    await mock_appliance.entities["Test.Switch"].update({"available": True})
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+
+async def test_available_reconnecting(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test entities become unavailable once the reconnect grace time passed."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    await mock_appliance.entities["Test.Switch"].update({"available": True})
+    await hass.async_block_till_done()
+    state_callback = mock_appliance.session.connection_state_callback
+
+    mock_appliance.session.connected = False
+    await state_callback(ConnectionState.DISCONNECTED)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=RECONNECT_GRACE))
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+    mock_appliance.session.connected = True
+    await state_callback(ConnectionState.CONNECTED)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+
 async def test_turn_on(
     hass: HomeAssistant,
     mock_appliance: MockAppliance,
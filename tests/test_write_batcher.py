@@ -0,0 +1,174 @@
+"""Tests for the value write batcher."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from custom_components.homeconnect_ws.const import DOMAIN
+from custom_components.homeconnect_ws.write_batcher import ValueWriteBatcher
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeconnect_websocket.errors import AccessError, CodeResponsError
+from homeconnect_websocket.message import Action, Message
+
+from . import setup_config_entry
+from .const import MOCK_CONFIG_DATA
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+async def test_merge_writes(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test concurrent writes are sent as one message."""
+    batcher = ValueWriteBatcher(hass, mock_appliance)
+    entity_1 = mock_appliance.entities["Test.Number"]
+    entity_2 = mock_appliance.entities["Test.Switch.Enum"]
+
+    await asyncio.gather(
+        batcher.async_set_value(entity_1, 10),
+        batcher.async_set_value(entity_2, "On"),
+        batcher.async_set_value(entity_1, 20),
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=[{"uid": 204, "value": 20}, {"uid": 202, "value": 1}],
+        )
+    )
+    assert batcher.as_dict() == {"queued_writes": 3, "sent_messages": 1}
+
+    mock_appliance.session.send_sync.reset_mock()
+    await batcher.async_set_value(entity_1, 30)
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(resource="/ro/values", action=Action.POST, data={"uid": 204, "value": 30})
+    )
+
+
+async def test_invalid_writes(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test invalid values are rejected by the library."""
+    batcher = ValueWriteBatcher(hass, mock_appliance)
+    entity = mock_appliance.entities["Test.Switch.Enum"]
+
+    with pytest.raises(ValueError, match="Value not in Enum"):
+        await batcher.async_set_value(entity, "Unknown")
+
+    await entity.update({"available": False})
+    with pytest.raises(AccessError, match="Not Available"):
+        await batcher.async_set_value(entity, "On")
+
+    await entity.update({"available": True, "access": "read"})
+    with pytest.raises(AccessError, match="Not Writable"):
+        await batcher.async_set_value(entity, "On")
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+
+async def test_write_error(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test a rejected value only fails its own writer."""
+    batcher = ValueWriteBatcher(hass, mock_appliance)
+
+    async def send_sync(message: Message) -> Message:
+        if isinstance(message.data, list) or message.data["uid"] == 201:
+            raise CodeResponsError(400, message.resource)
+        return Message(resource=message.resource, action=Action.RESPONSE)
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+    results = await asyncio.gather(
+        batcher.async_set_value(mock_appliance.entities["Test.Switch"], True),  # noqa: FBT003
+        batcher.async_set_value(mock_appliance.entities["Test.Number"], 10),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], CodeResponsError)
+    assert results[1] is None
+    assert batcher.sent_messages == 3
+
+
+async def test_write_error_resend_own_values(
+    hass: HomeAssistant, mock_appliance: MockAppliance
+) -> None:
+    """Test each writer resends its own values after a rejected merged message."""
+    batcher = ValueWriteBatcher(hass, mock_appliance)
+    entity_1 = mock_appliance.entities["Test.Number"]
+    entity_2 = mock_appliance.entities["Test.Switch.Enum"]
+    sent_values = []
+
+    async def send_sync(message: Message) -> Message:
+        if isinstance(message.data, list):
+            raise CodeResponsError(400, message.resource)
+        sent_values.append((message.data["uid"], message.data["value"]))
+        return Message(resource=message.resource, action=Action.RESPONSE)
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+    await asyncio.gather(
+        batcher.async_set_values({entity_1: 10, entity_2: "On"}),
+        batcher.async_set_value(entity_1, 20),
+    )
+    assert sent_values == [(204, 10), (202, 1), (204, 20)]
+
+
+async def test_shutdown(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test shutdown cancels queued and sending writes."""
+    batcher = ValueWriteBatcher(hass, mock_appliance)
+    entity = mock_appliance.entities["Test.Number"]
+    sent = asyncio.Event()
+
+    async def send_sync(_: Message) -> None:
+        sent.set()
+        await asyncio.Event().wait()
+
+    mock_appliance.session.send_sync.side_effect = send_sync
+    sending = hass.async_create_task(batcher.async_set_value(entity, 10))
+    await sent.wait()
+    queued = hass.async_create_task(batcher.async_set_value(entity, 20))
+    await asyncio.sleep(0)
+
+    batcher.async_shutdown()
+    with pytest.raises(asyncio.CancelledError):
+        await sending
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+
+async def test_set_values_service(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test set_values service."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    device = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, mock_appliance.info["deviceID"])}
+    )
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_values",
+        {"device_id": device.id, "values": {"Test.Switch": True, "Test.Switch.Enum": "Off"}},
+        blocking=True,
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=[{"uid": 201, "value": True}, {"uid": 202, "value": 0}],
+        )
+    )
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_values",
+            {"device_id": device.id, "values": {"Test.Missing": 1}},
+            blocking=True,
+        )
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_values",
+            {"device_id": device.id, "values": {"Test.Switch.Enum": "Unknown"}},
+            blocking=True,
+        )
@@ -0,0 +1,77 @@
+"""Tests for the state write scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_components.homeconnect_ws.write_scheduler import StateWriteScheduler
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_coalesce_writes(hass: HomeAssistant) -> None:
+    """Test writes of the same entity are coalesced."""
+    scheduler = StateWriteScheduler(hass, Mock())
+    entity_1 = Mock()
+    entity_2 = Mock()
+
+    scheduler.async_schedule_write(entity_1)
+    scheduler.async_schedule_write(entity_1)
+    scheduler.async_schedule_write(entity_2)
+    entity_1.async_write_ha_state.assert_not_called()
+
+    await hass.async_block_till_done()
+    entity_1.async_write_ha_state.assert_called_once()
+    entity_2.async_write_ha_state.assert_called_once()
+    assert scheduler.as_dict() == {
+        "scheduled_writes": 3,
+        "coalesced_writes": 1,
+        "flushed_writes": 2,
+        "pending_writes": 0,
+    }
+
+
+async def test_discard_and_shutdown(hass: HomeAssistant) -> None:
+    """Test discarding pending writes."""
+    scheduler = StateWriteScheduler(hass, Mock())
+    entity_1 = Mock()
+    entity_2 = Mock()
+
+    scheduler.async_schedule_write(entity_1)
+    scheduler.async_schedule_write(entity_2)
+    scheduler.async_discard(entity_1)
+    await hass.async_block_till_done()
+    entity_1.async_write_ha_state.assert_not_called()
+    entity_2.async_write_ha_state.assert_called_once()
+
+    scheduler.async_schedule_write(entity_1)
+    scheduler.async_shutdown()
+    await hass.async_block_till_done()
+    entity_1.async_write_ha_state.assert_not_called()
+
+
+async def test_pending_while_disconnected(hass: HomeAssistant) -> None:
+    """Test writes are kept until the appliance reconnects."""
+    appliance = Mock()
+    appliance.session.connected = False
+    appliance.session.connected_event = asyncio.Event()
+    scheduler = StateWriteScheduler(hass, appliance)
+    entity_1 = Mock()
+    entity_2 = Mock()
+
+    scheduler.async_schedule_write(entity_1)
+    scheduler.async_schedule_write(entity_2)
+    scheduler.async_schedule_write(entity_1)
+    await hass.async_block_till_done()
+    entity_1.async_write_ha_state.assert_not_called()
+    assert scheduler.pending_writes == 2
+
+    appliance.session.connected = True
+    appliance.session.connected_event.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    entity_1.async_write_ha_state.assert_called_once()
+    entity_2.async_write_ha_state.assert_called_once()
+    assert scheduler.pending_writes == 0
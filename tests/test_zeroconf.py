@@ -7,14 +7,17 @@ from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
+from aiohttp import ClientConnectionError
 from custom_components.homeconnect_ws import config_flow
 from custom_components.homeconnect_ws.const import (
     CONF_AES_IV,
+    CONF_DESCRIPTION_HASH,
     CONF_FILE,
     CONF_MANUAL_HOST,
     CONF_PSK,
     DOMAIN,
 )
+from custom_components.homeconnect_ws.description_store import get_description_hash
 from homeassistant.config_entries import SOURCE_ZEROCONF
 from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID, CONF_HOST, CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
@@ -92,7 +95,9 @@ async def test_zeroconf_init(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_TLS"
-    assert result["data"][CONF_DESCRIPTION] == MOCK_TLS_DEVICE_DESCRIPTION
+    assert result["data"][CONF_DESCRIPTION_HASH] == get_description_hash(
+        MOCK_TLS_DEVICE_DESCRIPTION
+    )
     assert result["data"][CONF_HOST] == "127.0.0.2"
     assert result["data"][CONF_PSK] == MOCK_TLS_DEVICE_INFO["key"]
     assert CONF_AES_IV not in result["data"]
@@ -101,6 +106,43 @@ async def test_zeroconf_init(
     mock_setup_entry.assert_awaited_once()
 
 
+async def test_zeroconf_candidate_hosts(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test falling back to the mDNS name when the discovered IP is not reachable."""
+    sockets = {
+        "127.0.0.2": AsyncMock(),
+        f"Test_Brand-Test_TLS-{MOCK_TLS_DEVICE_ID}": AsyncMock(),
+    }
+    sockets["127.0.0.2"].connect.side_effect = ClientConnectionError()
+    hc_socket = Mock()
+    tls_socket = Mock(side_effect=lambda host, _: sockets[host])
+    hc_socket.TlsSocket = tls_socket
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=MOCK_ZEROCONF_DATA
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+
+    assert tls_socket.call_count == 2
+    for socket in sockets.values():
+        socket.connect.assert_awaited_once()
+        socket.close.assert_awaited_once()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_HOST] == f"Test_Brand-Test_TLS-{MOCK_TLS_DEVICE_ID}"
+    mock_setup_entry.assert_awaited_once()
+
+
 async def test_zeroconf_duplicate_entry(
     hass: HomeAssistant,
     mock_setup_entry: AsyncMock,